@@ -1,4 +1,5 @@
 from .abstract_auth_impl import AbstractAuthImpl
+from .abstract_catalog_impl import AbstractCatalogImpl
 from .abstract_content_franchise_service import AbstractContentFranchiseImpl
 from .abstract_content_genre_impl import AbstractContentGenreImpl
 from .abstract_crud import AbstractCrud
@@ -12,6 +13,7 @@ from .abstract_content_impl import AbstractContentImpl
 
 __all__ = [
     "AbstractAuthImpl",
+    "AbstractCatalogImpl",
     "AbstractContentFranchiseImpl",
     "AbstractContentGenreImpl",
     "AbstractCrud",
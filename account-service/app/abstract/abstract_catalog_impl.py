@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+from sqlmodel import Session
+from app.models import Content
+from app.utils.wrappers import PageWrapper
+
+
+class AbstractCatalogImpl(ABC):
+
+    @abstractmethod
+    def add_contents(
+            self,
+            contents: list[Content],
+            genre_links: list[dict],
+            franchise_links: list[dict],
+            session: Session,
+            auto_commit: bool = True
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def refresh_content(
+            self,
+            content: Content,
+            session: Session,
+            auto_commit: bool = True
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def get_contents_by_genre(
+            self,
+            genre_id: UUID,
+            session: Session,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        pass
+
+    @abstractmethod
+    def get_contents_by_franchise(
+            self,
+            franchise_id: UUID,
+            session: Session,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        pass
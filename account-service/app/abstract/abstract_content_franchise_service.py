@@ -17,6 +17,15 @@ class AbstractContentFranchiseImpl(ABC):
     ) -> ContentFranchise:
         pass
 
+    @abstractmethod
+    def create_franchises(
+            self,
+            data: list[dict],
+            session: Session,
+            auto_commit: bool = True
+    ) -> list[ContentFranchise]:
+        pass
+
     @abstractmethod
     def get_franchises(
             self,
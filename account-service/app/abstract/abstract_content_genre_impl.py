@@ -17,6 +17,15 @@ class AbstractContentGenreImpl(ABC):
     ) -> ContentGenre:
         pass
 
+    @abstractmethod
+    def create_genres(
+            self,
+            data: list[dict],
+            session: Session,
+            auto_commit: bool = True
+    ) -> list[ContentGenre]:
+        pass
+
     @abstractmethod
     def get_genres(
             self,
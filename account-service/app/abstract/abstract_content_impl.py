@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional
 from uuid import UUID
 from sqlmodel import Session
 from app.models import Content
-from app.utils.wrappers import ListWrapper
+from app.utils.wrappers import PageWrapper
 
 
 class AbstractContentImpl(ABC):
@@ -16,11 +17,42 @@ class AbstractContentImpl(ABC):
     ) -> dict:
         pass
 
+    @abstractmethod
+    def create_contents(
+            self,
+            data: list[dict],
+            session: Session,
+            auto_commit: bool = True
+    ) -> list[Content]:
+        pass
+
     @abstractmethod
     def get_contents(
             self,
-            session: Session
-    ) -> ListWrapper:
+            session: Session,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        pass
+
+    @abstractmethod
+    def search_contents(
+            self,
+            text: str,
+            session: Session,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        pass
+
+    @abstractmethod
+    def stream_contents(
+            self,
+            session: Session,
+            fields: Optional[frozenset] = None
+    ) -> Iterator[Content]:
         pass
 
     @abstractmethod
@@ -1,7 +1,7 @@
 from abc import abstractmethod, ABC
-from typing import TypeVar, Any, Optional
+from typing import TypeVar, Any, Iterator, Optional
 from sqlmodel import SQLModel, Session
-from app.utils.wrappers import ListWrapper
+from app.utils.wrappers import ListWrapper, PageWrapper
 
 T = TypeVar("T", bound=SQLModel)
 
@@ -17,6 +17,15 @@ class AbstractCrud(ABC):
     ) -> T:
         pass
 
+    @abstractmethod
+    def create_many(
+            self,
+            models: list[T],
+            session: Session,
+            auto_commit: bool = True
+    ) -> list[T]:
+        pass
+
     @abstractmethod
     def update(
             self,
@@ -35,6 +44,26 @@ class AbstractCrud(ABC):
     ) -> ListWrapper:
         pass
 
+    @abstractmethod
+    def paginate(
+            self,
+            session: Session,
+            condition: Optional[bool] = None,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            deep: bool = True
+    ) -> PageWrapper:
+        pass
+
+    @abstractmethod
+    def stream(
+            self,
+            session: Session,
+            condition: Optional[bool] = None,
+            deep: bool = True
+    ) -> Iterator[T]:
+        pass
+
     @abstractmethod
     def get(
             self,
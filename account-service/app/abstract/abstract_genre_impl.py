@@ -23,6 +23,13 @@ class AbstractGenreImpl(ABC):
     ) -> ListWrapper:
         pass
 
+    @abstractmethod
+    def get_genres_json(
+            self,
+            session: Session
+    ) -> bytes:
+        pass
+
     @abstractmethod
     def get_genre(
             self,
@@ -23,6 +23,13 @@ class AbstractSubscriptionPlanImpl(ABC):
     ) -> ListWrapper:
         pass
 
+    @abstractmethod
+    def get_plans_json(
+            self,
+            session: Session
+    ) -> bytes:
+        pass
+
     @abstractmethod
     def get_plan(
             self,
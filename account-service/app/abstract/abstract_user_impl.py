@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional
 from uuid import UUID
 from sqlmodel import Session
 from app.models import User
-from app.utils.wrappers import ListWrapper
+from app.utils.wrappers import PageWrapper
 
 
 class AbstractUserImpl(ABC):
@@ -19,8 +20,21 @@ class AbstractUserImpl(ABC):
     @abstractmethod
     def get_users(
             self,
-            session: Session
-    ) -> ListWrapper:
+            session: Session,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        pass
+
+    @abstractmethod
+    def stream_users(
+            self,
+            session: Session,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> Iterator[User]:
         pass
 
     @abstractmethod
@@ -1,8 +1,9 @@
+from typing import Iterator, Optional
 from uuid import UUID
 from sqlmodel import Session
 from abc import ABC, abstractmethod
 from app.models import WatchHistory
-from app.utils.wrappers import ListWrapper
+from app.utils.wrappers import PageWrapper
 
 
 class AbstractWatchHistoryImpl(ABC):
@@ -30,10 +31,20 @@ class AbstractWatchHistoryImpl(ABC):
 
     @abstractmethod
     def get_watch_histories(
+            self,
+            user_id: UUID,
+            session: Session,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None
+    ) -> PageWrapper:
+        pass
+
+    @abstractmethod
+    def stream_watch_histories(
             self,
             user_id: UUID,
             session: Session
-    ) -> ListWrapper:
+    ) -> Iterator[WatchHistory]:
         pass
 
     @abstractmethod
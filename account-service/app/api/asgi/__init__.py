@@ -0,0 +1,11 @@
+from .content_controller import routes as content_routes
+from .subscription_plan_controller import routes as subscription_plan_routes
+
+routes = [
+    *content_routes,
+    *subscription_plan_routes
+]
+
+__all__ = [
+    "routes"
+]
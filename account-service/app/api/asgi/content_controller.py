@@ -0,0 +1,65 @@
+from typing import AsyncIterator, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+from app.api.asgi.responses import json_response, stream_response
+from app.config.async_sqlmodel_config import create_async_session
+from app.decorators.auth import async_jwt_required
+from app.decorators.conditional import async_conditional_get
+from app.models import Content, ContentFranchise, ContentGenre, Franchise, Genre
+from app.services import AsyncContentService
+from app.utils.builders import parse_fields
+from app.utils.media_urls import get_media_resolver
+from app.utils.serializers import stream_json_async
+
+content_service = AsyncContentService()
+
+
+async def stream_contents(
+        session: AsyncSession,
+        result: AsyncIterator[Content],
+        fields: Optional[frozenset]
+) -> AsyncIterator[bytes]:
+    try:
+        async for chunk in stream_json_async(result, fields=fields):
+            yield chunk
+    finally:
+        await session.close()
+
+
+@async_jwt_required
+@async_conditional_get(
+    Content,
+    ContentGenre,
+    ContentFranchise,
+    Genre,
+    Franchise,
+    salt=lambda: get_media_resolver().expires()
+)
+async def get_contents(request: Request) -> Response:
+    fields = parse_fields(request.query_params.get("fields"))
+    if request.query_params.get("stream") == "true":
+        # The session outlives this handler and is closed by the stream.
+        session = create_async_session()
+        try:
+            result = content_service.stream_contents(session, fields)
+        except BaseException:
+            await session.close()
+            raise
+        return stream_response(stream_contents(session, result, fields))
+
+    limit = request.query_params.get("limit")
+    async with create_async_session() as session:
+        result = await content_service.get_contents(
+            session,
+            request.query_params.get("cursor"),
+            int(limit) if limit and limit.lstrip("-").isdigit() else None,
+            fields
+        )
+        return json_response(result.to_json(fields=fields), 200, result.headers())
+
+
+routes = [
+    Route("/media/", get_contents, methods=["GET"]),
+]
@@ -0,0 +1,28 @@
+from typing import AsyncIterator, Optional
+from starlette.responses import Response, StreamingResponse
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Expose-Headers": "X-Next-Cursor, ETag",
+}
+
+
+def json_response(
+    body: bytes,
+    status_code: int = 200,
+    headers: Optional[dict] = None
+) -> Response:
+    return Response(
+        body,
+        status_code=status_code,
+        headers={**CORS_HEADERS, **(headers or {})},
+        media_type="application/json"
+    )
+
+
+def stream_response(chunks: AsyncIterator[bytes]) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        headers=CORS_HEADERS,
+        media_type="application/json"
+    )
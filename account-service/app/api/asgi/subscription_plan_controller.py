@@ -0,0 +1,23 @@
+from pydantic_core import to_json
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+from app.api.asgi.responses import json_response
+from app.config.async_sqlmodel_config import create_async_session
+from app.services import AsyncSubscriptionPlanService
+
+subscription_plan_service = AsyncSubscriptionPlanService()
+
+
+async def get_subscription_plan(request: Request) -> Response:
+    async with create_async_session() as session:
+        result = await subscription_plan_service.get_one_plan(
+            request.path_params["plan_name"],
+            session
+        )
+        return json_response(to_json(result.as_json()), 200)
+
+
+routes = [
+    Route("/subscription-plans/{plan_name}", get_subscription_plan, methods=["GET"]),
+]
@@ -1,17 +1,82 @@
 from app.config.sqlmodel_config import db
-from app.services import ContentService
-from flask import Blueprint, jsonify, Response
+from app.decorators.conditional import conditional_get
+from app.models import Content, ContentFranchise, ContentGenre, Franchise, Genre
+from app.services import CatalogService, ContentService
+from app.utils.builders import build_json_response, build_stream_response, parse_fields
+from app.utils.media_urls import get_media_resolver
+from app.utils.serializers import stream_json
+from flask import Blueprint, request, Response
 from flask_jwt_extended import jwt_required
 
 content_bl = Blueprint("content", __name__,
                        url_prefix="/media")
 
 content_service = ContentService()
+catalog_service = CatalogService()
 
 
 @content_bl.get("/")
 @jwt_required()
-def get_contents() -> tuple[Response, int]:
-    result = content_service.get_contents(db())
-    return jsonify(result.serialize()), 200
- 
\ No newline at end of file
+@conditional_get(
+    Content,
+    ContentGenre,
+    ContentFranchise,
+    Genre,
+    Franchise,
+    salt=lambda: get_media_resolver().expires()
+)
+def get_contents() -> tuple[Response, int, dict]:
+    fields = parse_fields(request.args.get("fields"))
+    if request.args.get("stream") == "true":
+        result = content_service.stream_contents(db(), fields)
+        return build_stream_response(stream_json(result, fields=fields)), 200, {}
+
+    result = content_service.get_contents(
+        db(),
+        request.args.get("cursor"),
+        request.args.get("limit", type=int),
+        fields
+    )
+    return build_json_response(result.to_json(fields=fields)), 200, result.headers()
+ 
+
+@content_bl.get("/search")
+@jwt_required()
+def search_contents() -> tuple[Response, int, dict]:
+    fields = parse_fields(request.args.get("fields"))
+    result = content_service.search_contents(
+        request.args.get("q"),
+        db(),
+        request.args.get("cursor"),
+        request.args.get("limit", type=int),
+        fields
+    )
+    return build_json_response(result.to_json(fields=fields)), 200, result.headers()
+
+
+@content_bl.get("/genres/<uuid:genre_id>")
+@jwt_required()
+def get_contents_by_genre(genre_id) -> tuple[Response, int, dict]:
+    fields = parse_fields(request.args.get("fields"))
+    result = catalog_service.get_contents_by_genre(
+        genre_id,
+        db(),
+        request.args.get("cursor"),
+        request.args.get("limit", type=int),
+        fields
+    )
+    return build_json_response(result.to_json(fields=fields)), 200, result.headers()
+
+
+@content_bl.get("/franchises/<uuid:franchise_id>")
+@jwt_required()
+def get_contents_by_franchise(franchise_id) -> tuple[Response, int, dict]:
+    fields = parse_fields(request.args.get("fields"))
+    result = catalog_service.get_contents_by_franchise(
+        franchise_id,
+        db(),
+        request.args.get("cursor"),
+        request.args.get("limit", type=int),
+        fields
+    )
+    return build_json_response(result.to_json(fields=fields)), 200, result.headers()
@@ -1,6 +1,7 @@
 from flask import Blueprint, Response, request, jsonify
 from app.config.sqlmodel_config import db
 from app.services import DeviceService
+from app.utils.builders import build_json_response
 from flask_jwt_extended import jwt_required
 
 device_bl = Blueprint("device", __name__,
@@ -27,7 +28,7 @@ def get_devices(user_id) -> tuple[Response, int]:
         user_id,
         db()
     )
-    return jsonify(result.serialize()), 200
+    return build_json_response(result.to_json()), 200
 
 
 @device_bl.get("/<uuid:device_id>")
@@ -1,6 +1,9 @@
 from app.config.sqlmodel_config import db
+from app.decorators.conditional import conditional_get
+from app.models import Genre
 from app.services import GenreService
-from flask import Blueprint, jsonify, Response
+from app.utils.builders import build_json_response
+from flask import Blueprint, Response
 
 genre_bl = Blueprint("genre", __name__,
                      url_prefix="/genres")
@@ -9,6 +12,7 @@ genre_services = GenreService()
 
 
 @genre_bl.get("/")
+@conditional_get(Genre)
 def get_genders() -> tuple[Response, int]:
-    result = genre_services.get_genres(db())
-    return jsonify(result.serialize()), 200
+    result = genre_services.get_genres_json(db())
+    return build_json_response(result), 200
@@ -0,0 +1,46 @@
+from time import perf_counter
+from flask import Blueprint, jsonify, Response
+from redis import RedisError
+from sqlalchemy.exc import SQLAlchemyError
+from app.config import redis_config
+from app.config.sqlmodel_config import get_pool_status, ping
+
+health_bl = Blueprint("health", __name__, url_prefix="/health")
+
+
+@health_bl.get("/db")
+def db_health() -> tuple[Response, int]:
+    started = perf_counter()
+    try:
+        ping()
+    except SQLAlchemyError as e:
+        return jsonify({
+            "status": "unavailable",
+            "error": repr(e),
+            "pool": get_pool_status()
+        }), 503
+
+    return jsonify({
+        "status": "ok",
+        "latency_ms": round((perf_counter() - started) * 1000, 2),
+        "pool": get_pool_status()
+    }), 200
+
+
+@health_bl.get("/redis")
+def redis_health() -> tuple[Response, int]:
+    started = perf_counter()
+    try:
+        redis_config.ping()
+    except RedisError as e:
+        return jsonify({
+            "status": "unavailable",
+            "error": repr(e),
+            "pool": redis_config.get_redis_status()
+        }), 503
+
+    return jsonify({
+        "status": "ok",
+        "latency_ms": round((perf_counter() - started) * 1000, 2),
+        "pool": redis_config.get_redis_status()
+    }), 200
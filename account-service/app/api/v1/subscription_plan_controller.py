@@ -1,6 +1,9 @@
 from flask import Blueprint, request, jsonify, Response
 from app.config.sqlmodel_config import db
+from app.decorators.conditional import conditional_get
+from app.models import SubscriptionPlan
 from app.services import SubscriptionPlanService
+from app.utils.builders import build_json_response
 
 subscription_plan_bl = Blueprint("subscription", __name__,
                                  url_prefix="/subscription-plans")
@@ -18,9 +21,10 @@ def create_subscription_plan() -> tuple[Response, int]:
 
 
 @subscription_plan_bl.get("/")
+@conditional_get(SubscriptionPlan)
 def get_subscription_plans() -> tuple[Response, int]:
-    result = subscription_plan_service.get_plans(db())
-    return jsonify(result.serialize()), 200
+    result = subscription_plan_service.get_plans_json(db())
+    return build_json_response(result), 200
 
 
 @subscription_plan_bl.get("/<string:plan_name>")
@@ -1,6 +1,8 @@
 from flask import Blueprint, request, jsonify, Response
 from app.config.sqlmodel_config import db
 from app.services import UserService
+from app.utils.builders import build_json_response, build_stream_response, parse_fields
+from app.utils.serializers import stream_json
 from app.orchestrators import UserOrchestrator
 from flask_jwt_extended import jwt_required
 from app.dtos import CreateUserDto, UpdateUserDto
@@ -27,9 +29,20 @@ def get_user(user_id) -> tuple[Response, int]:
 
 @user_bl.get("/")
 @jwt_required()
-def get_users() -> tuple[Response, int]:
-    result = user_service.get_users(db())
-    return jsonify(result.serialize(deep=False)), 200
+def get_users() -> tuple[Response, int, dict]:
+    fields = parse_fields(request.args.get("fields"))
+    if request.args.get("stream") == "true":
+        result = user_service.stream_users(db(), deep=False, fields=fields)
+        return build_stream_response(stream_json(result, deep=False, fields=fields)), 200, {}
+
+    result = user_service.get_users(
+        db(),
+        request.args.get("cursor"),
+        request.args.get("limit", type=int),
+        deep=False,
+        fields=fields
+    )
+    return build_json_response(result.to_json(deep=False, fields=fields)), 200, result.headers()
 
 
 @user_bl.put("/<uuid:user_id>")
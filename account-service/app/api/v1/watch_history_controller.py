@@ -1,6 +1,8 @@
 from flask import Blueprint, Response, request, jsonify
 from app.config.sqlmodel_config import db
 from app.services import WatchHistoryService
+from app.utils.builders import build_json_response, build_stream_response
+from app.utils.serializers import stream_json
 from flask_jwt_extended import jwt_required
 
 watch_bl = Blueprint("watch_history", __name__,
@@ -22,9 +24,18 @@ def create_watch_history(user_id) -> tuple[Response, int]:
 
 @watch_bl.get("/")
 @jwt_required()
-def get_watch_histories(user_id) -> tuple[Response, int]:
-    result = watch_service.get_watch_histories(user_id, db())
-    return jsonify(result.serialize()), 200
+def get_watch_histories(user_id) -> tuple[Response, int, dict]:
+    if request.args.get("stream") == "true":
+        result = watch_service.stream_watch_histories(user_id, db())
+        return build_stream_response(stream_json(result)), 200, {}
+
+    result = watch_service.get_watch_histories(
+        user_id,
+        db(),
+        request.args.get("cursor"),
+        request.args.get("limit", type=int)
+    )
+    return build_json_response(result.to_json()), 200, result.headers()
 
 
 @watch_bl.get("/<uuid:watch_id>")
@@ -0,0 +1,60 @@
+from typing import Optional
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config.sqlmodel_config import pool_options
+from app.models import *
+from app.utils.settings import get_settings
+
+settings = get_settings()
+
+_async_engine: Optional[AsyncEngine] = None
+
+
+def async_database_url() -> str:
+    url = make_url(settings.postgres_internal_url)
+    return url.set(drivername="postgresql+asyncpg").render_as_string(
+        hide_password=False
+    )
+
+
+def async_engine_options() -> dict:
+    if settings.db_pgbouncer:
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+            },
+        }
+
+    connect_args = {}
+    if settings.db_statement_timeout:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.db_statement_timeout)
+        }
+
+    return {**pool_options(), "connect_args": connect_args}
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            async_database_url(),
+            echo=False,
+            **async_engine_options()
+        )
+    return _async_engine
+
+
+def create_async_session() -> AsyncSession:
+    return AsyncSession(get_async_engine(), expire_on_commit=False)
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
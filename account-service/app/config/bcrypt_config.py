@@ -0,0 +1,107 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import cpu_count, get_context
+from threading import BoundedSemaphore, Lock
+from typing import Optional
+from bcrypt import checkpw, gensalt, hashpw
+from app.exceptions.exceptions import ServerBusyException
+from app.utils.settings import get_settings
+
+settings = get_settings()
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = Lock()
+_pending = BoundedSemaphore(settings.bcrypt_max_pending)
+
+
+def pool_size() -> int:
+    # Every gunicorn worker builds its own pool, so each one only takes its
+    # share of the host budget instead of BCRYPT_WORKERS apiece.
+    total = settings.bcrypt_workers or cpu_count()
+    web_workers = settings.web_workers or cpu_count() * 2 + 1
+    return max(1, total // web_workers)
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # Children are spawned rather than forked so they never inherit
+                # the parent's threads, sockets or engine pool.
+                _executor = ProcessPoolExecutor(
+                    max_workers=pool_size(),
+                    mp_context=get_context("spawn")
+                )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def replace_executor(broken: ProcessPoolExecutor) -> None:
+    global _executor
+    with _executor_lock:
+        # Another thread may already have swapped in a fresh pool.
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def submit_to_pool(fn, *args) -> tuple[ProcessPoolExecutor, Future]:
+    executor = get_executor()
+    try:
+        return executor, executor.submit(fn, *args)
+    except BrokenProcessPool:
+        # A child died since the last call; the pool refuses new work
+        # until it is replaced.
+        replace_executor(executor)
+        executor = get_executor()
+        return executor, executor.submit(fn, *args)
+
+
+def submit(fn, *args) -> bytes | bool:
+    if not _pending.acquire(blocking=False):
+        raise ServerBusyException("Too many logins in progress, try again later")
+
+    try:
+        executor, future = submit_to_pool(fn, *args)
+    except BaseException:
+        _pending.release()
+        raise
+
+    future.add_done_callback(lambda _: _pending.release())
+    try:
+        return future.result(timeout=settings.bcrypt_timeout)
+    except TimeoutError:
+        raise ServerBusyException("Password hashing timed out, try again later")
+    except BrokenProcessPool:
+        replace_executor(executor)
+        raise ServerBusyException("Password hashing failed, try again later")
+
+
+def hash_password(password: str) -> str:
+    return submit(
+        hashpw,
+        password.encode("utf-8"),
+        gensalt(settings.bcrypt_rounds)
+    ).decode("utf-8")
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    return submit(
+        checkpw,
+        password.encode("utf-8"),
+        hashed.encode("utf-8")
+    )
+
+
+def needs_rehash(hashed: str) -> bool:
+    try:
+        return int(hashed.split("$")[2]) != settings.bcrypt_rounds
+    except (IndexError, ValueError):
+        return True
@@ -0,0 +1,42 @@
+import logging
+from sqlalchemy import inspect, text
+from sqlmodel import Session, SQLModel
+from app.config.sqlmodel_config import get_engine
+from app.repositories.catalog_repository import (
+    CatalogFranchiseRepository,
+    CatalogGenreRepository,
+)
+
+logger = logging.getLogger("bootstrap")
+
+SCHEMA_LOCK_ID = 7_340_112
+
+
+def bootstrap_schema() -> None:
+    engine = get_engine()
+
+    with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.execute(
+                text("SELECT pg_advisory_xact_lock(:lock_id)"),
+                {"lock_id": SCHEMA_LOCK_ID}
+            )
+            # Needed by the trigram index on content.title.
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        existing = set(inspect(connection).get_table_names())
+        SQLModel.metadata.create_all(connection)
+
+        # The catalog read model is kept current by the orchestrator, so it
+        # only needs filling from the link tables when it is first created.
+        with Session(bind=connection) as session:
+            for repository in (CatalogGenreRepository(), CatalogFranchiseRepository()):
+                if repository.model.__tablename__ not in existing:
+                    repository.backfill(session)
+                    logger.info(f"📚 Backfilled {repository.model.__tablename__}")
+
+    logger.info("🗄️ Database schema is up to date")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    bootstrap_schema()
@@ -0,0 +1,117 @@
+import logging
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Optional
+import redis
+from sqlalchemy import event
+from sqlmodel import Session
+from app.config.redis_config import get_redis
+from app.config.version_config import get_versions
+from app.utils.settings import get_settings
+
+settings = get_settings()
+logger = logging.getLogger("cache")
+
+CACHE_PREFIX = "flask:cache:"
+# Keys are table names so entries follow the same version counters the
+# conditional GET check uses.
+GENRES_KEY = "genre"
+PLANS_KEY = "subscription_plan"
+
+
+def current_version(key: str) -> Optional[int]:
+    state = get_versions([key])
+    return state[0][0] if state is not None else None
+
+
+class ReferenceCache:
+
+    def __init__(self, ttl: int, max_size: int, use_redis: bool, redis_ttl: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.use_redis = use_redis
+        self.redis_ttl = redis_ttl
+        self.entries: OrderedDict[str, tuple[float, Optional[int], bytes]] = OrderedDict()
+        self.lock = Lock()
+
+    def get_local(self, key: str, version: Optional[int]):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires, cached_version, body = entry
+            # A body cached under another version would be served under
+            # the new version's ETag, so it only counts when they match.
+            # Without versions the TTL is all there is.
+            if expires < time.monotonic() or \
+                    (version is not None and cached_version != version):
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return body
+
+    def set_local(self, key: str, version: Optional[int], body: bytes) -> None:
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, version, body)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def get_shared(self, key: str, version: Optional[int]):
+        if not self.use_redis or version is None:
+            return None
+        try:
+            return get_redis().get(f"{CACHE_PREFIX}{key}:{version}")
+        except redis.RedisError:
+            logger.exception(f"⚠️ Could not read {key} from the shared cache")
+            return None
+
+    def set_shared(self, key: str, version: Optional[int], body: bytes) -> None:
+        if not self.use_redis or version is None:
+            return
+        try:
+            get_redis().set(f"{CACHE_PREFIX}{key}:{version}", body, ex=self.redis_ttl)
+        except redis.RedisError:
+            logger.exception(f"⚠️ Could not write {key} to the shared cache")
+
+    def get(self, key: str, loader: Callable[[], bytes]) -> bytes:
+        version = current_version(key)
+        body = self.get_local(key, version)
+        if body is not None:
+            return body
+
+        body = self.get_shared(key, version)
+        if body is None:
+            body = loader()
+            self.set_shared(key, version, body)
+
+        self.set_local(key, version, body)
+        return body
+
+    def invalidate(self, *keys: str) -> None:
+        # Shared entries are keyed by version and age out on their own.
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+
+    def invalidate_on_commit(self, session: Session, *keys: str) -> None:
+        self.invalidate(*keys)
+        # Without auto_commit the write is still pending, and a read in
+        # between would cache the old rows again, so drop them once more
+        # when the caller commits.
+        if session.in_transaction():
+            event.listen(
+                session,
+                "after_commit",
+                lambda _: self.invalidate(*keys),
+                once=True
+            )
+
+
+cache = ReferenceCache(
+    settings.cache_local_ttl,
+    settings.cache_local_size,
+    settings.cache_redis,
+    settings.cache_redis_ttl
+)
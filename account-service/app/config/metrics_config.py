@@ -0,0 +1,66 @@
+import os
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    start_http_server,
+)
+from prometheus_client import multiprocess
+from app.utils.settings import get_settings
+
+settings = get_settings()
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 900)
+
+events_processed = Counter(
+    "worker_events_processed_total",
+    "Upload events handled successfully",
+    ["key"]
+)
+events_failed = Counter(
+    "worker_events_failed_total",
+    "Upload events that raised, by what happened to them next",
+    ["outcome"]
+)
+events_rolled_back = Counter(
+    "worker_events_rolled_back_total",
+    "Upload events sent to mediahub for media rollback"
+)
+event_latency = Histogram(
+    "worker_event_latency_seconds",
+    "Time from mediahub enqueue to the event being committed",
+    buckets=LATENCY_BUCKETS
+)
+event_processing = Histogram(
+    "worker_event_processing_seconds",
+    "Time spent handling one event or one batch",
+    ["mode"]
+)
+queue_length = Gauge(
+    "worker_queue_length",
+    "Sampled length of the worker's Redis keys",
+    ["queue"],
+    multiprocess_mode="mostrecent"
+)
+
+
+def metrics_registry() -> CollectorRegistry:
+    # Process-mode consumers write their samples to PROMETHEUS_MULTIPROC_DIR,
+    # so the exporter has to aggregate those files instead of its own memory.
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def start_metrics_server() -> None:
+    if settings.worker_metrics_port:
+        start_http_server(
+            settings.worker_metrics_port,
+            addr=settings.worker_metrics_addr,
+            registry=metrics_registry()
+        )
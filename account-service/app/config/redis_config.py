@@ -0,0 +1,120 @@
+from contextlib import contextmanager
+from threading import Lock
+from typing import Iterator, Optional
+import redis
+import redis.asyncio
+from redis.client import Pipeline
+from app.utils.settings import get_settings
+
+settings = get_settings()
+
+_pool: Optional[redis.BlockingConnectionPool] = None
+_pool_lock = Lock()
+_request_pool: Optional[redis.BlockingConnectionPool] = None
+_async_pool: Optional[redis.asyncio.BlockingConnectionPool] = None
+
+
+def pool_options() -> dict:
+    return {
+        "max_connections": settings.redis_max_connections,
+        "timeout": settings.redis_pool_timeout,
+        "health_check_interval": settings.redis_health_check_interval,
+        "socket_keepalive": True,
+        "socket_connect_timeout": settings.redis_connect_timeout,
+        "retry_on_timeout": True,
+    }
+
+
+def get_redis_pool() -> redis.BlockingConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # A blocking pool makes callers wait for a free connection
+                # instead of failing once every connection is checked out.
+                _pool = redis.BlockingConnectionPool.from_url(
+                    settings.redis_internal_url,
+                    **pool_options()
+                )
+    return _pool
+
+
+def get_redis() -> redis.Redis:
+    return redis.Redis(connection_pool=get_redis_pool())
+
+
+def get_request_redis_pool() -> redis.BlockingConnectionPool:
+    global _request_pool
+    if _request_pool is None:
+        with _pool_lock:
+            if _request_pool is None:
+                # Lookups on the request path fail fast instead of holding
+                # the request for the full connect timeout.
+                _request_pool = redis.BlockingConnectionPool.from_url(
+                    settings.redis_internal_url,
+                    **{
+                        **pool_options(),
+                        "timeout": settings.redis_request_timeout,
+                        "socket_timeout": settings.redis_request_timeout,
+                        "socket_connect_timeout": settings.redis_request_timeout,
+                        "retry_on_timeout": False,
+                    }
+                )
+    return _request_pool
+
+
+def get_request_redis() -> redis.Redis:
+    return redis.Redis(connection_pool=get_request_redis_pool())
+
+
+def get_async_redis_pool() -> redis.asyncio.BlockingConnectionPool:
+    global _async_pool
+    if _async_pool is None:
+        _async_pool = redis.asyncio.BlockingConnectionPool.from_url(
+            settings.redis_internal_url,
+            **pool_options()
+        )
+    return _async_pool
+
+
+def get_async_redis() -> redis.asyncio.Redis:
+    return redis.asyncio.Redis(connection_pool=get_async_redis_pool())
+
+
+@contextmanager
+def pipeline(transaction: bool = False) -> Iterator[Pipeline]:
+    with get_redis().pipeline(transaction=transaction) as pipe:
+        yield pipe
+        pipe.execute()
+
+
+def get_redis_status() -> dict:
+    pool = get_redis_pool()
+    # Unused slots in the blocking pool's queue are None placeholders.
+    idle = sum(1 for connection in list(pool.pool.queue) if connection is not None)
+    return {
+        "max_connections": pool.max_connections,
+        "created": len(pool._connections),
+        "idle": idle,
+    }
+
+
+def ping() -> None:
+    get_redis().ping()
+
+
+def dispose_redis() -> None:
+    global _pool, _request_pool
+    if _pool is not None:
+        _pool.disconnect()
+        _pool = None
+    if _request_pool is not None:
+        _request_pool.disconnect()
+        _request_pool = None
+
+
+async def dispose_async_redis() -> None:
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.disconnect()
+        _async_pool = None
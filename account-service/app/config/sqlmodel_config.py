@@ -1,4 +1,9 @@
-from sqlmodel import create_engine, SQLModel, Session
+from threading import Lock
+from sqlalchemy import event, text
+from sqlalchemy.pool import NullPool
+from typing import Optional
+from sqlalchemy.engine import Engine
+from sqlmodel import create_engine, Session
 from flask import g
 from sqlalchemy.schema import CreateTable
 from app.models import *
@@ -6,12 +11,116 @@ from app.utils.settings import get_settings
 
 settings = get_settings()
 
-engine = create_engine(settings.postgres_internal_url, echo=False)
-SQLModel.metadata.create_all(engine)
+_engine: Optional[Engine] = None
+_engine_lock = Lock()
+
+pool_stats = {
+    "connects": 0,
+    "checkouts": 0,
+    "checkins": 0,
+    "invalidations": 0,
+    "peak_checked_out": 0,
+}
+_stats_lock = Lock()
+
+
+def pool_options() -> dict:
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def engine_options() -> dict:
+    if settings.db_pgbouncer:
+        return {"poolclass": NullPool}
+
+    connect_args = {}
+    if settings.db_statement_timeout:
+        connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout}"
+
+    return {**pool_options(), "connect_args": connect_args}
+
+
+def register_pool_events(engine) -> None:
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        with _stats_lock:
+            pool_stats["connects"] += 1
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        with _stats_lock:
+            pool_stats["checkouts"] += 1
+            checked_out = pool_stats["checkouts"] - pool_stats["checkins"]
+            pool_stats["peak_checked_out"] = max(
+                pool_stats["peak_checked_out"],
+                checked_out
+            )
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        with _stats_lock:
+            pool_stats["checkins"] += 1
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        with _stats_lock:
+            pool_stats["invalidations"] += 1
+
+    if settings.db_pgbouncer and settings.db_statement_timeout:
+
+        @event.listens_for(engine, "begin")
+        def on_begin(connection):
+            connection.exec_driver_sql(
+                f"SET LOCAL statement_timeout = {int(settings.db_statement_timeout)}"
+            )
+
+
+def get_engine() -> Engine:
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(
+                    settings.postgres_internal_url,
+                    echo=False,
+                    **engine_options()
+                )
+                register_pool_events(engine)
+                _engine = engine
+    return _engine
+
+
+def dispose_engine(close: bool = True) -> None:
+    if _engine is not None:
+        _engine.dispose(close=close)
+
+
+def get_pool_status() -> dict:
+    pool = get_engine().pool
+    status = {"class": type(pool).__name__}
+
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, name):
+            status[name] = getattr(pool, name)()
+
+    with _stats_lock:
+        status.update(pool_stats)
+    return status
+
+
+def ping() -> None:
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
 
 
 def create_session() -> Session:
-    return Session(engine)
+    return Session(get_engine())
 
 
 def db () -> Session:
@@ -21,4 +130,4 @@ def db () -> Session:
 
 
 #for table in SQLModel.metadata.tables.values():
-#   print(str(CreateTable(table).compile(engine)))
+#   print(str(CreateTable(table).compile(get_engine())))
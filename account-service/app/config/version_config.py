@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import time
+from threading import Lock
+from datetime import datetime, timezone
+from typing import Optional
+import redis
+from sqlalchemy import event
+from flask import g, has_request_context
+from sqlmodel import Session
+from app.config.redis_config import get_async_redis, get_request_redis
+from app.utils.settings import get_settings
+
+settings = get_settings()
+logger = logging.getLogger("versions")
+
+VERSIONS_KEY = "flask:table:versions"
+PENDING_TABLES = "changed_tables"
+COMMITTED_TABLES = "committed_tables"
+SAVEPOINT_TABLES = "savepoint_tables"
+DEFER_PUBLISH = "defer_publish"
+
+_unpublished: set[str] = set()
+_unpublished_lock = Lock()
+
+# While Redis is unreachable, requests skip the version lookups entirely
+# and only probe again every REDIS_RETRY_AFTER seconds.
+_down = False
+_retry_at = 0.0
+
+
+def is_down() -> bool:
+    return _down and time.monotonic() < _retry_at
+
+
+def record_failure(error: Exception) -> None:
+    global _down, _retry_at
+    _retry_at = time.monotonic() + settings.redis_retry_after
+    if not _down:
+        _down = True
+        logger.warning(
+            f"⚠️ Redis unreachable, conditional GETs disabled "
+            f"for now: {error}"
+        )
+
+
+def record_success() -> None:
+    global _down
+    if _down:
+        _down = False
+        logger.info("Redis reachable again, conditional GETs resumed")
+
+
+def take_unpublished(tables: set[str]) -> set[str]:
+    # Bumps that failed are retried with the next one, otherwise clients
+    # would keep getting 304 for rows that did change.
+    with _unpublished_lock:
+        tables = tables | _unpublished
+        _unpublished.clear()
+    return tables
+
+
+def keep_unpublished(tables: set[str]) -> None:
+    with _unpublished_lock:
+        _unpublished.update(tables)
+
+
+def publish_changes(tables: set[str]) -> None:
+    tables = take_unpublished(tables)
+    if not tables:
+        return
+
+    if is_down():
+        keep_unpublished(tables)
+        return
+
+    now = time.time()
+    try:
+        with get_request_redis().pipeline(transaction=False) as pipe:
+            for table in tables:
+                pipe.hincrby(VERSIONS_KEY, table, 1)
+                pipe.hset(VERSIONS_KEY, f"{table}:modified", now)
+            pipe.execute()
+    except redis.RedisError as error:
+        record_failure(error)
+        keep_unpublished(tables)
+        return
+
+    record_success()
+    if has_request_context():
+        g.pop("table_versions", None)
+
+
+async def publish_changes_async(tables: set[str]) -> None:
+    tables = take_unpublished(tables)
+    if not tables:
+        return
+
+    if is_down():
+        keep_unpublished(tables)
+        return
+
+    now = time.time()
+    try:
+        async with get_async_redis().pipeline(transaction=False) as pipe:
+            for table in tables:
+                pipe.hincrby(VERSIONS_KEY, table, 1)
+                pipe.hset(VERSIONS_KEY, f"{table}:modified", now)
+            await pipe.execute()
+    except redis.RedisError as error:
+        record_failure(error)
+        keep_unpublished(tables)
+        return
+
+    record_success()
+
+
+def on_commit(session: Session) -> None:
+    tables = session.info.pop(PENDING_TABLES, None)
+    if not tables:
+        return
+    # Sessions driven from an event loop must not block it on the sync
+    # client; their owner publishes with publish_changes_async instead.
+    if session.info.get(DEFER_PUBLISH):
+        session.info.setdefault(COMMITTED_TABLES, set()).update(tables)
+    else:
+        publish_changes(tables)
+
+
+def take_committed(session: Session) -> set[str]:
+    return session.info.pop(COMMITTED_TABLES, set())
+
+
+def on_rollback(session: Session) -> None:
+    session.info.pop(PENDING_TABLES, None)
+    session.info.pop(SAVEPOINT_TABLES, None)
+
+
+def on_savepoint(session: Session, transaction) -> None:
+    # Remember what was pending when the savepoint opened, so rolling it
+    # back forgets the tables marked inside it but keeps the ones before.
+    if transaction.nested:
+        pending = session.info.get(PENDING_TABLES, set())
+        session.info.setdefault(SAVEPOINT_TABLES, {})[transaction] = set(pending)
+
+
+def on_soft_rollback(session: Session, previous_transaction) -> None:
+    if not previous_transaction.nested:
+        return
+    saved = session.info.get(SAVEPOINT_TABLES, {}).pop(previous_transaction, None)
+    if saved is not None:
+        session.info[PENDING_TABLES] = saved
+
+
+def on_transaction_end(session: Session, transaction) -> None:
+    if transaction.nested:
+        session.info.get(SAVEPOINT_TABLES, {}).pop(transaction, None)
+
+
+def mark_changed(session: Session, *tables: str) -> None:
+    # Versions are bumped once the outermost transaction commits, so a
+    # reader never sees a new version before the rows it stands for.
+    session.info.setdefault(PENDING_TABLES, set()).update(tables)
+
+
+# Registered on the class rather than per session: a savepoint may open
+# before the first mark_changed, and its snapshot has to exist by then.
+event.listen(Session, "after_commit", on_commit)
+event.listen(Session, "after_rollback", on_rollback)
+event.listen(Session, "after_transaction_create", on_savepoint)
+event.listen(Session, "after_soft_rollback", on_soft_rollback)
+event.listen(Session, "after_transaction_end", on_transaction_end)
+
+
+def get_versions(tables: list[str]) -> Optional[tuple[list[int], Optional[datetime]]]:
+    # The conditional GET check and the reference cache ask for the same
+    # tables within one request, so they share a single read.
+    if not has_request_context():
+        return read_versions(tables)
+    memo = g.setdefault("table_versions", {})
+    key = tuple(tables)
+    if key not in memo:
+        memo[key] = read_versions(tables)
+    return memo[key]
+
+
+def read_versions(tables: list[str]) -> Optional[tuple[list[int], Optional[datetime]]]:
+    if is_down():
+        return None
+    if _unpublished:
+        publish_changes(set())
+        if _unpublished:
+            return None
+
+    try:
+        values = get_request_redis().hmget(VERSIONS_KEY, version_fields(tables))
+    except redis.RedisError as error:
+        record_failure(error)
+        return None
+    record_success()
+    return parse_versions(values)
+
+
+async def get_versions_async(tables: list[str]) -> Optional[tuple[list[int], Optional[datetime]]]:
+    if is_down():
+        return None
+    if _unpublished:
+        await publish_changes_async(set())
+        if _unpublished:
+            return None
+
+    try:
+        values = await asyncio.wait_for(
+            get_async_redis().hmget(VERSIONS_KEY, version_fields(tables)),
+            settings.redis_request_timeout
+        )
+    except (redis.RedisError, asyncio.TimeoutError) as error:
+        record_failure(error)
+        return None
+    record_success()
+    return parse_versions(values)
+
+
+def version_fields(tables: list[str]) -> list[str]:
+    return [field for table in tables for field in (table, f"{table}:modified")]
+
+
+def parse_versions(values: list) -> tuple[list[int], Optional[datetime]]:
+    versions = [int(value or 0) for value in values[0::2]]
+    modified = [float(value) for value in values[1::2] if value is not None]
+    last_modified = None
+    if modified:
+        last_modified = datetime.fromtimestamp(int(max(modified)), timezone.utc)
+    return versions, last_modified
@@ -0,0 +1,37 @@
+from typing import Callable
+from functools import wraps
+import jwt
+from starlette.requests import Request
+from app.exceptions.exceptions import (
+    InvalidTokenException,
+    ExpiredTokenException,
+    NotFoundTokenException
+)
+
+
+def async_jwt_required(func: Callable) -> Callable:
+    @wraps(func)
+    async def wrapper(request: Request, *args, **kwargs) -> Callable:
+        header = request.headers.get("Authorization", "")
+        scheme, _, token = header.partition(" ")
+
+        if scheme != "Bearer" or not token:
+            raise NotFoundTokenException(repr("Missing Authorization Header"))
+
+        try:
+            claims = jwt.decode(
+                token,
+                request.app.state.jwt_secret_key,
+                algorithms=["HS256"]
+            )
+        except jwt.ExpiredSignatureError:
+            raise ExpiredTokenException("Your token has expired")
+        except jwt.InvalidTokenError as e:
+            raise InvalidTokenException(repr(str(e)))
+
+        if claims.get("type") != "access":
+            raise InvalidTokenException(repr("Only non-refresh tokens are allowed"))
+
+        request.state.jwt_identity = claims.get("sub")
+        return await func(request, *args, **kwargs)
+    return wrapper
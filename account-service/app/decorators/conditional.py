@@ -0,0 +1,88 @@
+import hashlib
+from typing import Callable, Optional, Type
+from functools import wraps
+from flask import Response, make_response, request
+from sqlmodel import SQLModel
+from starlette.requests import Request
+from starlette.responses import Response as AsyncResponse
+from werkzeug.http import http_date, parse_etags
+from app.config.version_config import get_versions, get_versions_async
+
+
+def build_version_etag(key: str, versions: list[int], salt: str = "") -> str:
+    seed = f"{key}|{','.join(map(str, versions))}|{salt}"
+    return hashlib.blake2b(seed.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def conditional_get(
+        *models: Type[SQLModel],
+        salt: Optional[Callable[[], object]] = None
+) -> Callable:
+    tables = [model.__tablename__ for model in models]
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Response:
+            state = get_versions(tables)
+            if state is None:
+                return func(*args, **kwargs)
+
+            versions, last_modified = state
+            etag = build_version_etag(
+                request.full_path,
+                versions,
+                str(salt()) if salt else ""
+            )
+
+            # Answered from the version counters alone, before the view
+            # opens a session.
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+            else:
+                response = make_response(func(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            if last_modified:
+                response.last_modified = last_modified
+            return response
+        return wrapper
+    return decorator
+
+
+def async_conditional_get(
+        *models: Type[SQLModel],
+        salt: Optional[Callable[[], object]] = None
+) -> Callable:
+    tables = [model.__tablename__ for model in models]
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(request: Request, *args, **kwargs) -> AsyncResponse:
+            state = await get_versions_async(tables)
+            if state is None:
+                return await func(request, *args, **kwargs)
+
+            versions, last_modified = state
+            etag = build_version_etag(
+                f"{request.url.path}?{request.url.query}",
+                versions,
+                str(salt()) if salt else ""
+            )
+
+            if parse_etags(request.headers.get("If-None-Match")).contains(etag):
+                response = AsyncResponse(status_code=304)
+            else:
+                response = await func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+
+            response.headers["ETag"] = f'"{etag}"'
+            response.headers["Cache-Control"] = "no-cache"
+            if last_modified:
+                response.headers["Last-Modified"] = http_date(last_modified)
+            return response
+        return wrapper
+    return decorator
@@ -2,6 +2,7 @@ from typing import Callable
 from sqlalchemy.exc import (
     SQLAlchemyError,
     IntegrityError,
+    DataError,
     DBAPIError,
     NoResultFound,
     MultipleResultsFound,
@@ -20,35 +21,64 @@ from app.exceptions.exceptions import (
 )
 
 
+HANDLED_EXCEPTIONS = (
+    SQLAlchemyError,
+    FileNotFoundError,
+    ValueError,
+    TypeError,
+    KeyError,
+    AttributeError,
+    PermissionError,
+)
+
+
+def translate_exception(e: Exception) -> Exception:
+    if isinstance(e, IntegrityError):
+        return DuplicatedRecordException(repr(e))
+
+    # Values the column rejects, e.g. too long or out of range.
+    if isinstance(e, DataError):
+        return DataValidationException(repr(e))
+
+    if isinstance(e, DBAPIError):
+        return ServerDBConnectionException(repr(e))
+
+    if isinstance(e, NoResultFound):
+        return NotFoundException(str(e))
+
+    if isinstance(e, MultipleResultsFound):
+        return ServerUnknownException(repr(e))
+
+    if isinstance(e, SQLAlchemyError):
+        return ServerUnknownException(repr(e))
+
+    exception_map = {
+        ValueError: DataValidationException,
+        TypeError: TypeException,
+        KeyError: KeyException,
+        AttributeError: AttributeException,
+        PermissionError: PermissionException,
+    }
+    return exception_map[type(e)](repr(e))
+
+
 def exception_handler(func: Callable) -> Callable:
     @wraps(func)
     def wrapper(self, *args, **kwargs) -> Callable:
         try:
             return func(self, *args, **kwargs)
 
-        except IntegrityError as e:
-            raise DuplicatedRecordException(repr(e))
-
-        except DBAPIError as e:
-            raise ServerDBConnectionException(repr(e))
-
-        except NoResultFound as e:
-            raise NotFoundException(str(e))
+        except HANDLED_EXCEPTIONS as e:
+            raise translate_exception(e)
+    return wrapper
 
-        except MultipleResultsFound as e:
-            raise ServerUnknownException(repr(e))
 
-        except SQLAlchemyError as e:
-            raise ServerUnknownException(repr(e))
+def async_exception_handler(func: Callable) -> Callable:
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs) -> Callable:
+        try:
+            return await func(self, *args, **kwargs)
 
-        except (FileNotFoundError, ValueError, TypeError,
-                KeyError, AttributeError, PermissionError) as e:
-            exception_map = {
-                ValueError: DataValidationException,
-                TypeError: TypeException,
-                KeyError: KeyException,
-                AttributeError: AttributeException,
-                PermissionError: PermissionException,
-            }
-            raise exception_map[type(e)](repr(e))
+        except HANDLED_EXCEPTIONS as e:
+            raise translate_exception(e)
     return wrapper
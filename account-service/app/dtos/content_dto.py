@@ -1,5 +1,5 @@
-from typing import Optional 
-from pydantic import BaseModel, Field
+from typing import Optional, Self
+from pydantic import BaseModel, Field, model_validator
 from datetime import date
 
 
@@ -11,9 +11,18 @@ class CreateContentDto(BaseModel):
     thumbnail_file: str = Field(alias="thumbnailFile")
     content_file: str = Field(alias="contentFile")
     trailer_file: str = Field(alias="trailerFile")
+    upload_id: Optional[str] = Field(default=None, alias="uploadId")
     genres: Optional[list] = []
     franchises: Optional[list] = []
     
+    @model_validator(mode="after")
+    def default_upload_id(self) -> Self:
+        # Older mediahub payloads carry no uploadId; the stored file name
+        # embeds the same per-upload UUID, so it is an equally stable key.
+        if not self.upload_id:
+            self.upload_id = self.content_file
+        return self
+
     def flat_info(self) -> dict:
         return self.model_dump(exclude={"genres", "franchises"})
         
\ No newline at end of file
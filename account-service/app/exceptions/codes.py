@@ -89,6 +89,7 @@ class ErrorCodes(Enum):
     SERVER_NOT_WORKING = 1300
     SERVER_DB_CONNECTION_ERROR = 1301
     SERVER_UNKNOWN_ERROR = 1302
+    SERVER_BUSY = 1303
     ERROR_DATA_VALIDATION = 1400
     SQL_MODEL_ERROR = 1101
     SQL_INTEGRITY_ERROR = 1102
@@ -104,6 +104,11 @@ class ServerNotWorkingException(BaseExceptionError):
         super().__init__(message, error_code=ErrorCodes.SERVER_NOT_WORKING, http_code=HTTPCodes.INTERNAL_SERVER_ERROR, details=details)
 
 
+class ServerBusyException(BaseExceptionError):
+    def __init__(self, message, details=None) -> None:
+        super().__init__(message, error_code=ErrorCodes.SERVER_BUSY, http_code=HTTPCodes.SERVICE_UNAVAILABLE, details=details)
+
+
 class ServerDBConnectionException(BaseExceptionError):
     def __init__(self, message, details=None) -> None:
         super().__init__(message, error_code=ErrorCodes.SERVER_DB_CONNECTION_ERROR, http_code=HTTPCodes.INTERNAL_SERVER_ERROR, details=details)
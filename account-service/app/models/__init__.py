@@ -11,6 +11,7 @@ from .franchise_model import Franchise
 from .serie_model import Serie
 from .season_model import Season
 from .subscription_plan_model import SubscriptionPlan
+from .catalog_model import CatalogGenre, CatalogFranchise
 from .base_model import EntityBaseModel
 from .base_user_model import BaseUser
 
@@ -30,6 +31,8 @@ __all__ = [
     "Serie",
     "Season",
     "SubscriptionPlan", 
+    "CatalogGenre",
+    "CatalogFranchise",
     "EntityBaseModel",
     "BaseUser"
 ]
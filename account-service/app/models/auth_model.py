@@ -1,11 +1,11 @@
 from enum import Enum
 from typing import Optional
-from bcrypt import hashpw, gensalt
 from sqlmodel import Field, Relationship
 from uuid import UUID, uuid4
 from datetime import datetime
 from pydantic import EmailStr
 from app.models.base_model import EntityBaseModel
+from app.config.bcrypt_config import hash_password
 
 
 class Roles(str, Enum):
@@ -36,10 +36,7 @@ class Auth(EntityBaseModel, table=True):
 
     @classmethod
     def password_hash(cls, password: str) -> str:
-        return hashpw(
-            password.encode("utf-8"),
-            gensalt(12)
-        ).decode("utf-8")
+        return hash_password(password)
 
     def hide_fields(self) -> set:
         return {"password"}
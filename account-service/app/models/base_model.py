@@ -1,26 +1,69 @@
+from typing import ClassVar
+from typing_extensions import TypedDict
 from pydantic import TypeAdapter
 from sqlmodel import SQLModel
 
+_partial_adapters: dict[type, TypeAdapter] = {}
+
 
 class EntityBaseModel(SQLModel):
+    # Maps each key returned by extra_fields to the attributes it reads, so
+    # a sparse query knows what to load for it.
+    extra_sources: ClassVar[dict[str, tuple[str, ...]]] = {}
 
     def as_json(self, deep: bool = True) -> dict:
-        return self.model_dump(mode="json", exclude=self.hide_fields())
+        data = self.model_dump(mode="json", exclude=self.hide_fields())
+        for key, value in self.extra_fields(deep).items():
+            if isinstance(value, EntityBaseModel):
+                value = value.as_json()
+            elif isinstance(value, list):
+                value = [item.as_json() for item in value]
+            data[key] = value
+        return data
+
+    def extra_fields(self, deep: bool = True) -> dict:
+        return {}
+
+    def sparse_extra_fields(self, fields: frozenset) -> dict:
+        return {
+            key: value
+            for key, value in self.extra_fields().items()
+            if key in fields
+        }
     
     def _meta_fields(self) -> dict:
         return self.__class__.model_fields
 
-    def fromkeys(self, **kwargs) -> None:
+    @classmethod
+    def partial_adapter(cls) -> TypeAdapter:
+        adapter = _partial_adapters.get(cls)
+        if adapter is None:
+            fields = {
+                name: info.annotation
+                for name, info in cls.model_fields.items()
+            }
+            partial = TypedDict(f"{cls.__name__}Partial", fields, total=False)
+            adapter = TypeAdapter(partial)
+            _partial_adapters[cls] = adapter
+        return adapter
+
+    def validate_partial(self, data: dict) -> dict:
         pf = self.protected_fields()
-        fields_info = self._meta_fields() 
-    
-        for key, value in kwargs.items():
+        fields_info = self._meta_fields()
+        values = {}
+
+        for key, value in data.items():
             if key in pf:
                 continue
+            if key not in fields_info:
+                raise KeyError(key)
+            values[key] = value
 
-            field_meta = fields_info[key].annotation
-            cheked = TypeAdapter(field_meta).validate_python(value)
-            setattr(self, key, cheked)
+        return self.partial_adapter().validate_python(values)
+
+    def fromkeys(self, **kwargs) -> None:
+        for key, value in self.validate_partial(kwargs).items():
+            setattr(self, key, value)
 
 
     def protected_fields(self) -> set:
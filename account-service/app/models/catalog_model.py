@@ -0,0 +1,77 @@
+from datetime import datetime, date
+from typing import ClassVar, Optional
+from uuid import UUID
+from sqlalchemy import Index
+from sqlmodel import Field
+from app.models.base_model import EntityBaseModel
+from app.utils.media_urls import get_media_resolver
+
+CATALOG_FIELDS = (
+    "title",
+    "description",
+    "release_date",
+    "duration",
+    "thumbnail_file",
+    "content_file",
+    "trailer_file",
+    "created_at",
+)
+
+
+class CatalogEntry(EntityBaseModel):
+    extra_sources: ClassVar[dict[str, tuple[str, ...]]] = {
+        "thumbnail_url": ("thumbnail_file",),
+        "content_url": ("content_file",),
+        "trailer_url": ("trailer_file",),
+    }
+
+    content_id: UUID = Field(foreign_key="content.id", primary_key=True, ondelete="CASCADE")
+    title: str
+    description: str
+    release_date: date
+    duration: str
+    thumbnail_file: str
+    content_file: str
+    trailer_file: Optional[str] = None
+    created_at: datetime
+
+    def extra_fields(self, deep: bool = True) -> dict:
+        return get_media_resolver().resolve(
+            self.thumbnail_file,
+            self.content_file,
+            self.trailer_file
+        )
+
+    def sparse_extra_fields(self, fields: frozenset) -> dict:
+        urls = get_media_resolver().resolve(
+            self.thumbnail_file if "thumbnail_url" in fields else None,
+            self.content_file if "content_url" in fields else None,
+            self.trailer_file if "trailer_url" in fields else None
+        )
+        return {key: value for key, value in urls.items() if key in fields}
+
+
+class CatalogGenre(CatalogEntry, table=True):
+    __tablename__ = "catalog_genre"
+
+    genre_id: UUID = Field(foreign_key="genre.id", primary_key=True, ondelete="CASCADE")
+
+
+class CatalogFranchise(CatalogEntry, table=True):
+    __tablename__ = "catalog_franchise"
+
+    franchise_id: UUID = Field(foreign_key="franchise.id", primary_key=True, ondelete="CASCADE")
+
+
+Index(
+    "ix_catalog_genre_release_date",
+    CatalogGenre.genre_id,
+    CatalogGenre.release_date.desc(),
+    CatalogGenre.content_id.desc()
+)
+Index(
+    "ix_catalog_franchise_release_date",
+    CatalogFranchise.franchise_id,
+    CatalogFranchise.release_date.desc(),
+    CatalogFranchise.content_id.desc()
+)
@@ -1,14 +1,42 @@
 from datetime import datetime, date
 from uuid import uuid4, UUID
+from sqlalchemy import Column, Index
+from sqlalchemy.orm import deferred
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Field, Relationship
-from typing import Optional
+from typing import ClassVar, Optional
 from app.models.content_genre_model import ContentGenre
 from app.models.content_franchise_model import ContentFranchise
 from app.models.base_model import EntityBaseModel
-from app.utils.builders import build_spring_url
+from app.utils.media_urls import get_media_resolver
+
+# Only the search query reads the vector, and it does so in SQL, so the
+# column stays out of every other SELECT.
+search_vector_column = Column("search_vector", TSVECTOR)
 
 
 class Content(EntityBaseModel, table=True):
+    extra_sources: ClassVar[dict[str, tuple[str, ...]]] = {
+        "franchises": ("franchises",),
+        "genres": ("genres",),
+        "thumbnail_url": ("thumbnail_file",),
+        "content_url": ("content_file",),
+        "trailer_url": ("trailer_file",),
+    }
+    __table_args__ = (
+        Index("ix_content_created_at_id", "created_at", "id"),
+        Index("ix_content_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_content_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"}
+        ),
+    )
+    __mapper_args__ = {
+        "properties": {"search_vector": deferred(search_vector_column)}
+    }
+
     id: UUID = Field(default_factory=lambda: uuid4(), primary_key=True, index=True)
     title: str
     description: str
@@ -17,8 +45,10 @@ class Content(EntityBaseModel, table=True):
     thumbnail_file: str = Field(alias="thumbnailFile")
     content_file: str = Field(alias="contentFile")
     trailer_file: Optional[str] = Field(alias="trailerFile")
+    upload_id: Optional[str] = Field(default=None, unique=True, alias="uploadId")
     created_at: datetime = Field(default_factory=lambda: datetime.now())
     updated_at: Optional[datetime] = None
+    search_vector: Optional[str] = Field(default=None, sa_column=search_vector_column)
 
     episode_number: Optional[int] = None
     season_id: Optional[UUID] = Field(default=None, foreign_key="season.id")
@@ -41,13 +71,31 @@ class Content(EntityBaseModel, table=True):
         self.updated_at = datetime.now()
         super().fromkeys(**kwargs)
 
-    def as_json(self, deep: bool = True) -> dict:
-        data = super().as_json(deep)
-        data["franchises"] = [franchise.as_json() for franchise in self.franchises]
-        data["genres"] = [genre.as_json() for genre in self.genres]
-        data["thumbnail_url"] = build_spring_url("thumbnails", self.thumbnail_file)
-        data["content_url"] = build_spring_url("streaming", self.content_file, "?source=movie")
-        data["trailer_url"] = build_spring_url("streaming", self.trailer_file, "?source=trailer")
+    def protected_fields(self) -> set:
+        return {"id", "search_vector"}
+
+    def hide_fields(self) -> set:
+        return {"search_vector"}
+
+    def extra_fields(self, deep: bool = True) -> dict:
+        return {
+            "franchises": self.franchises,
+            "genres": self.genres,
+            **get_media_resolver().resolve(
+                self.thumbnail_file,
+                self.content_file,
+                self.trailer_file
+            )
+        }
+
+    def sparse_extra_fields(self, fields: frozenset) -> dict:
+        data = {key: getattr(self, key) for key in ("franchises", "genres") if key in fields}
+        urls = get_media_resolver().resolve(
+            self.thumbnail_file if "thumbnail_url" in fields else None,
+            self.content_file if "content_url" in fields else None,
+            self.trailer_file if "trailer_url" in fields else None
+        )
+        data.update((key, value) for key, value in urls.items() if key in fields)
         return data
 
     class Config:
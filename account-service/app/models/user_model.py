@@ -1,10 +1,20 @@
-from typing import Optional
+from typing import ClassVar, Optional
 from uuid import UUID
+from sqlalchemy import Index
 from sqlmodel import Relationship, Field
 from app.models.base_user_model import BaseUser
 
 
 class User(BaseUser, table=True):
+    extra_sources: ClassVar[dict[str, tuple[str, ...]]] = {
+        "auth_data": ("auth",),
+        "subscription_data": ("subscription_plan_id", "subscription"),
+        "devices": ("devices",),
+    }
+    __table_args__ = (
+        Index("ix_user_created_at_id", "created_at", "id"),
+    )
+
     subscription_plan_id: Optional[UUID] = Field(foreign_key="subscription_plan.id",
                                                  nullable=True, default=None)
     auth: "Auth" = Relationship(back_populates="user",
@@ -15,13 +25,25 @@ class User(BaseUser, table=True):
         sa_relationship_kwargs={"cascade": "all, delete-orphan"})
     subscription: "SubscriptionPlan" = Relationship()
 
-    def as_json(self, deep: bool = True) -> dict:
-        data = super().as_json()
-        data["auth_data"] = self.auth.as_json()
-        data["subscription_data"] = self.subscription.as_json() \
+    def extra_fields(self, deep: bool = True) -> dict:
+        data = {
+            "auth_data": self.auth,
+            "subscription_data": self.subscription
             if self.subscription_plan_id else None
+        }
         if deep:
-            data["devices"] = [device.as_json() for device in self.devices]
+            data["devices"] = self.devices
+        return data
+
+    def sparse_extra_fields(self, fields: frozenset) -> dict:
+        data = {}
+        if "auth_data" in fields:
+            data["auth_data"] = self.auth
+        if "subscription_data" in fields:
+            data["subscription_data"] = self.subscription \
+                if self.subscription_plan_id else None
+        if "devices" in fields:
+            data["devices"] = self.devices
         return data
 
     def hide_fields(self) -> set:
@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import uuid4, UUID
-from sqlalchemy import Column, DOUBLE_PRECISION
+from sqlalchemy import Column, DOUBLE_PRECISION, Index
 from sqlmodel import Field
 from typing import Optional
 from app.models.base_model import EntityBaseModel
@@ -8,6 +8,9 @@ from app.models.base_model import EntityBaseModel
 
 class WatchHistory(EntityBaseModel, table=True):
     __tablename__ = "watch_history"
+    __table_args__ = (
+        Index("ix_watch_history_user_id_watched_at_id", "user_id", "watched_at", "id"),
+    )
 
     id: UUID = Field(default_factory=lambda: uuid4(), primary_key=True)
     user_id: UUID = Field(foreign_key="user.id", nullable=False)
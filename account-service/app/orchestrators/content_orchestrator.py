@@ -1,9 +1,15 @@
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import Session
 from app.decorators.handlers import exception_handler
 from app.models import Content
+from app.services import CatalogService
 from app.services import ContentService
 from app.services import ContentFranchiseService
 from app.services import ContentGenreService
+from app.services import FranchiseService
+from app.services import GenreService
 from app.dtos import CreateContentDto
 
 
@@ -13,21 +19,85 @@ class ContentOrchestrator:
         self.content_service = ContentService()
         self.genre_service = ContentGenreService()
         self.franchise_service = ContentFranchiseService()
+        self.genres = GenreService()
+        self.franchises = FranchiseService()
+        self.catalog_service = CatalogService()
 
     @exception_handler
     def register_content(
             self,
             data: CreateContentDto,
-            session: Session
-    ) -> Content:
-        content = self.content_service.create_content(data.flat_info(), session, False)
-        session.flush()
-
-        for genre_id in data.genres:
-            self.genre_service.create_genre(genre_id, content.id, session, False)
-            
-        for franchise_id in data.franchises:
-            self.franchise_service.create_franchise(franchise_id, content.id, session, False)
-        
-        session.commit()
-        return self.content_service.get_content(content.id, session)
+            session: Session,
+            auto_commit: bool = True
+    ) -> Optional[Content]:
+        contents = self.register_contents([data], session, auto_commit)
+        return contents[0] if contents else None
+
+    @exception_handler
+    def register_contents(
+            self,
+            data: list[CreateContentDto],
+            session: Session,
+            auto_commit: bool = True
+    ) -> list[Content]:
+        # Contents whose upload_id is already registered are skipped by the
+        # insert, so a redelivered event adds neither a row nor links.
+        contents = self.content_service.create_contents(
+            [item.flat_info() for item in data],
+            session,
+            False
+        )
+        items = {item.upload_id: item for item in data}
+
+        genre_links = []
+        franchise_links = []
+        for content in contents:
+            item = items[content.upload_id]
+            genre_links += [
+                {"content_id": content.id, "genre_id": UUID(str(genre_id))}
+                for genre_id in item.genres
+            ]
+            franchise_links += [
+                {"content_id": content.id, "franchise_id": UUID(str(franchise_id))}
+                for franchise_id in item.franchises
+            ]
+
+        self.genre_service.create_genres(genre_links, session, False)
+        self.franchise_service.create_franchises(franchise_links, session, False)
+        self.catalog_service.add_contents(
+            contents,
+            genre_links,
+            franchise_links,
+            session,
+            False
+        )
+
+        if auto_commit:
+            session.commit()
+
+        # Each referenced genre and franchise is loaded once for the whole batch.
+        genres = self.genres.get_genres_by_ids(
+            list({link["genre_id"] for link in genre_links}),
+            session
+        ).items if genre_links else []
+        franchises = self.franchises.get_franchises_by_ids(
+            list({link["franchise_id"] for link in franchise_links}),
+            session
+        ).items if franchise_links else []
+
+        genres = {genre.id: genre for genre in genres}
+        franchises = {franchise.id: franchise for franchise in franchises}
+
+        for content in contents:
+            item = items[content.upload_id]
+            set_committed_value(content, "genres", [
+                genres[UUID(str(genre_id))]
+                for genre_id in item.genres
+                if UUID(str(genre_id)) in genres
+            ])
+            set_committed_value(content, "franchises", [
+                franchises[UUID(str(franchise_id))]
+                for franchise_id in item.franchises
+                if UUID(str(franchise_id)) in franchises
+            ])
+        return contents
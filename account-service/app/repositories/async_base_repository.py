@@ -0,0 +1,140 @@
+from typing import Any, AsyncIterator, Optional
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.abstract.abstract_crud import T
+from app.decorators.handlers import async_exception_handler, exception_handler
+from app.repositories.base_repository import BaseRepository
+from app.utils.wrappers import ListWrapper, PageWrapper
+
+
+class AsyncBaseRepository:
+
+    def __init__(self, repository: BaseRepository) -> None:
+        self.repository = repository
+        self.model = repository.model
+
+    @async_exception_handler
+    async def create(
+            self,
+            model: T,
+            session: AsyncSession,
+            auto_commit: bool = True
+    ) -> T:
+        session.add(model)
+        if auto_commit:
+            await session.commit()
+            await session.refresh(model)
+        return model
+
+    @async_exception_handler
+    async def select(
+            self,
+            session: AsyncSession,
+            deep: bool = True
+    ) -> ListWrapper:
+        stmt = select(self.model).options(*self.repository.load_options(deep))
+        result = await session.exec(stmt)
+        return ListWrapper[self.model](list(result.unique()))
+
+    @async_exception_handler
+    async def paginate(
+            self,
+            session: AsyncSession,
+            condition: Optional[bool] = None,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        stmt, limit = self.repository.page_statement(condition, cursor, limit, deep, fields)
+        result = await session.exec(stmt)
+        return self.repository.build_page(list(result.unique()), limit)
+
+    @exception_handler
+    def stream(
+            self,
+            session: AsyncSession,
+            condition: Optional[bool] = None,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> AsyncIterator[T]:
+        # Built before the first row is awaited so unknown fields fail
+        # before the response has started.
+        stmt = self.repository.stream_statement(condition, deep, fields)
+        return self.stream_rows(session, stmt)
+
+    async def stream_rows(self, session: AsyncSession, stmt) -> AsyncIterator[T]:
+        result = await session.stream_scalars(stmt)
+        async for item in result:
+            yield item
+
+    @async_exception_handler
+    async def get(
+            self,
+            _id: Any,
+            session: AsyncSession
+    ) -> Optional[T]:
+        return await session.get(
+            self.model,
+            _id,
+            options=self.repository.load_options()
+        )
+
+    @async_exception_handler
+    async def delete(
+            self,
+            _id: Any,
+            session: AsyncSession,
+            auto_commit: bool = True
+    ) -> Optional[T]:
+        result = await self.get(_id, session)
+        if result:
+            await session.delete(result)
+            if auto_commit:
+                await session.commit()
+        return result
+
+    @async_exception_handler
+    async def update(
+            self,
+            _id: Any,
+            data: dict,
+            session: AsyncSession,
+            auto_commit: bool = True
+    ) -> Optional[T]:
+        result = await self.get(_id, session)
+        if result:
+            result.fromkeys(**data)
+            session.add(result)
+            if auto_commit:
+                await session.commit()
+                await session.refresh(result)
+        return result
+
+    @async_exception_handler
+    async def get_one(
+            self,
+            condition: bool,
+            session: AsyncSession
+    ) -> Optional[T]:
+        stmt = (
+            select(self.model)
+            .options(*self.repository.load_options())
+            .where(condition)
+        )
+        result = await session.exec(stmt)
+        return result.unique().first()
+
+    @async_exception_handler
+    async def get_many(
+            self,
+            condition: bool,
+            session: AsyncSession
+    ) -> ListWrapper:
+        stmt = (
+            select(self.model)
+            .options(*self.repository.load_options())
+            .where(condition)
+        )
+        result = await session.exec(stmt)
+        return ListWrapper[self.model](list(result.unique()))
@@ -0,0 +1,8 @@
+from app.repositories.async_base_repository import AsyncBaseRepository
+from app.repositories.content_repostitory import ContentRepository
+
+
+class AsyncContentRepository(AsyncBaseRepository):
+
+    def __init__(self) -> None:
+        super().__init__(ContentRepository())
@@ -0,0 +1,8 @@
+from app.repositories.async_base_repository import AsyncBaseRepository
+from app.repositories.subscription_plan_repository import SubscriptionPlanRepository
+
+
+class AsyncSubscriptionPlanRepository(AsyncBaseRepository):
+
+    def __init__(self) -> None:
+        super().__init__(SubscriptionPlanRepository())
@@ -1,17 +1,163 @@
-from typing import Any, Type, Optional
-from sqlalchemy import ScalarResult
+from typing import Any, Iterator, Type, Optional
+from sqlalchemy import Date, ScalarResult, Select, insert, inspect, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload, make_transient_to_detached
 from sqlmodel import Session
 from app.abstract.abstract_crud import AbstractCrud, T
+from app.config.version_config import mark_changed
 from sqlmodel import select, update
 from app.decorators.handlers import exception_handler
-from app.utils.wrappers import ListWrapper
+from app.utils.builders import build_cursor, parse_cursor
+from app.utils.settings import get_settings
+from app.utils.wrappers import ListWrapper, PageWrapper
+
+settings = get_settings()
+
+LOADERS = {
+    "selectin": selectinload,
+    "joined": joinedload,
+}
+
+UPSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
 
 
 class BaseRepository(AbstractCrud):
 
+    cursor_field: str = "created_at"
+    id_field: str = "id"
+    descending: bool = False
+    load_plan: dict[str, str] = {}
+    shallow_load_plan: Optional[dict[str, str]] = None
+    conflict_fields: Optional[list[str]] = None
+
     def __init__(self, model: Type[T]) -> None:
         self.model = model
 
+    def mark_changed(self, session: Session) -> None:
+        mark_changed(session, self.model.__tablename__)
+
+    def load_options(self, deep: bool = True) -> list:
+        plan = self.load_plan
+        if not deep and self.shallow_load_plan is not None:
+            plan = self.shallow_load_plan
+
+        options = []
+        for relationship, strategy in plan.items():
+            if strategy not in LOADERS:
+                raise ValueError(f"Invalid load strategy: '{strategy}'")
+            loader = LOADERS[strategy]
+            options.append(loader(getattr(self.model, relationship)))
+        return options
+
+    def sparse_options(self, fields: frozenset) -> list:
+        mapper = inspect(self.model)
+        sources = {column.key for column in mapper.primary_key}
+        sources.update((self.cursor_field, self.id_field))
+
+        for field in fields:
+            if field in self.model.extra_sources:
+                sources.update(self.model.extra_sources[field])
+            elif field in mapper.column_attrs:
+                sources.add(field)
+            else:
+                raise ValueError(f"Unknown field: '{field}'")
+
+        # Only the requested columns are selected, and anything else that
+        # would be touched raises instead of quietly lazy-loading per row.
+        options = [load_only(
+            *(getattr(self.model, key) for key in sources if key in mapper.column_attrs),
+            raiseload=True
+        )]
+        for relationship in sources.intersection(mapper.relationships.keys()):
+            strategy = self.load_plan.get(relationship, "selectin")
+            options.append(LOADERS[strategy](getattr(self.model, relationship)))
+        options.append(raiseload("*"))
+        return options
+
+    def query_options(
+            self,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> list:
+        if fields:
+            return self.sparse_options(fields)
+        return self.load_options(deep)
+
+    def order_columns(self) -> tuple:
+        position = getattr(self.model, self.cursor_field)
+        _id = getattr(self.model, self.id_field)
+        if self.descending:
+            return position.desc(), _id.desc()
+        return position, _id
+
+    def page_statement(
+            self,
+            condition: Optional[bool] = None,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> tuple[Select, int]:
+        limit = limit or settings.page_size
+        if limit < 1:
+            raise ValueError(f"Invalid page size: {limit}")
+        limit = min(limit, settings.max_page_size)
+
+        position = getattr(self.model, self.cursor_field)
+        _id = getattr(self.model, self.id_field)
+        stmt = select(self.model).options(*self.query_options(deep, fields))
+
+        if condition is not None:
+            stmt = stmt.where(condition)
+
+        if cursor:
+            last_position, last_id = parse_cursor(cursor)
+            # Comparing a DATE column to a timestamp would cast the column
+            # and keep the index from serving the range.
+            if isinstance(position.type, Date):
+                last_position = last_position.date()
+            key, last = tuple_(position, _id), tuple_(last_position, last_id)
+            stmt = stmt.where(key < last if self.descending else key > last)
+
+        return stmt.order_by(*self.order_columns()).limit(limit + 1), limit
+
+    def build_page(
+            self,
+            data: list[T],
+            limit: int
+    ) -> PageWrapper:
+        next_cursor = None
+        if len(data) > limit:
+            data = data[:limit]
+            last = data[-1]
+            next_cursor = build_cursor(
+                getattr(last, self.cursor_field),
+                getattr(last, self.id_field)
+            )
+        return PageWrapper[self.model](data, next_cursor)
+
+    def stream_statement(
+            self,
+            condition: Optional[bool] = None,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> Select:
+        stmt = (
+            select(self.model)
+            .options(*self.query_options(deep, fields))
+            .execution_options(yield_per=settings.stream_batch_size)
+        )
+
+        if condition is not None:
+            stmt = stmt.where(condition)
+
+        # Same order as the pages, so a stream and a walk over the cursors
+        # return rows in the same sequence.
+        return stmt.order_by(*self.order_columns())
+
     @exception_handler
     def create(
             self,
@@ -20,26 +166,97 @@ class BaseRepository(AbstractCrud):
             auto_commit: bool = True
     ) -> T:
         session.add(model)
+        self.mark_changed(session)
         if auto_commit:
             session.commit()
             session.refresh(model)
         return model
     
+    def insert_ignore_statement(self, session: Session):
+        dialect = session.get_bind().dialect.name
+        if dialect not in UPSERTS:
+            raise ValueError(f"ON CONFLICT is not supported for '{dialect}'")
+
+        return UPSERTS[dialect](self.model).on_conflict_do_nothing(
+            index_elements=self.conflict_fields
+        )
+
+    @exception_handler
+    def create_many(
+            self,
+            models: list[T],
+            session: Session = None,
+            auto_commit: bool = True
+    ) -> list[T]:
+        if not models:
+            return models
+
+        # One multi-row INSERT per batch instead of a flush per object. The
+        # instances already hold every column value, so they are returned
+        # detached rather than re-fetched or expired by the commit.
+        rows = [model.model_dump() for model in models]
+
+        if self.conflict_fields:
+            inserted = set(session.scalars(
+                self.insert_ignore_statement(session).returning(self.model.id),
+                rows
+            ))
+            models = [model for model in models if model.id in inserted]
+        else:
+            session.execute(insert(self.model), rows)
+
+        if models:
+            self.mark_changed(session)
+        if auto_commit:
+            session.commit()
+
+        for model in models:
+            make_transient_to_detached(model)
+        return models
+
     @exception_handler
     def select(
             self,
-            session: Session
+            session: Session,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
     ) -> ListWrapper:
-        data = list(session.exec(select(self.model)))
+        stmt = select(self.model).options(*self.query_options(deep, fields))
+        data = list(session.exec(stmt).unique())
         return ListWrapper[self.model](data)
 
+    @exception_handler
+    def paginate(
+            self,
+            session: Session,
+            condition: Optional[bool] = None,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        stmt, limit = self.page_statement(condition, cursor, limit, deep, fields)
+        data = list(session.exec(stmt).unique())
+        return self.build_page(data, limit)
+
+    @exception_handler
+    def stream(
+            self,
+            session: Session,
+            condition: Optional[bool] = None,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> Iterator[T]:
+        stmt = self.stream_statement(condition, deep, fields)
+        return session.exec(stmt)
+
     @exception_handler
     def get(
             self,
             _id: Any,
             session: Session
     ) -> Optional[T]:
-        return session.get(self.model, _id)
+        return session.get(self.model, _id, options=self.load_options())
 
     @exception_handler
     def delete(
@@ -51,6 +268,7 @@ class BaseRepository(AbstractCrud):
         result = self.get(_id, session)
         if result:
             session.delete(result)
+            self.mark_changed(session)
             if auto_commit:
                 session.commit()
         return result
@@ -67,6 +285,7 @@ class BaseRepository(AbstractCrud):
         if result:
             result.fromkeys(**data)
             session.add(result)
+            self.mark_changed(session)
             if auto_commit:
                 session.commit()
                 session.refresh(result)
@@ -81,9 +300,10 @@ class BaseRepository(AbstractCrud):
     ) -> ScalarResult:
         stmt = (
             select(self.model)
+            .options(*self.load_options())
             .where(condition)
         )
-        return session.exec(stmt)
+        return session.exec(stmt).unique()
     
     def update_by_condition(
         self, 
@@ -126,6 +346,7 @@ class BaseRepository(AbstractCrud):
         result = self.get_one(condition, session)
         if result:
             session.delete(result)
+            self.mark_changed(session)
             if auto_commit:
                 session.commit()
         return result
@@ -140,6 +361,8 @@ class BaseRepository(AbstractCrud):
         result = self.get_many(condition, session)
         for r in result:
             session.delete(r)
+        if result.items:
+            self.mark_changed(session)
         if auto_commit:
             session.commit()
         return result
@@ -156,6 +379,7 @@ class BaseRepository(AbstractCrud):
         if result:
             result.fromkeys(**data)
             session.add(result)
+            self.mark_changed(session)
             if auto_commit:
                 session.commit()
                 session.refresh(result)
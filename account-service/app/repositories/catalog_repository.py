@@ -0,0 +1,64 @@
+from uuid import UUID
+from sqlalchemy import select, update
+from sqlmodel import Session
+from app.decorators.handlers import exception_handler
+from app.models import CatalogFranchise, CatalogGenre, Content, ContentFranchise, ContentGenre
+from app.models.catalog_model import CATALOG_FIELDS
+from app.repositories.base_repository import BaseRepository
+
+
+class CatalogRepository(BaseRepository):
+
+    cursor_field = "release_date"
+    id_field = "content_id"
+    descending = True
+    facet_field: str
+    link_model: type
+
+    @exception_handler
+    def refresh(
+            self,
+            content: Content,
+            session: Session
+    ) -> None:
+        session.execute(
+            update(self.model)
+            .where(self.model.content_id == content.id)
+            .values({field: getattr(content, field) for field in CATALOG_FIELDS})
+        )
+
+    @exception_handler
+    def backfill(
+            self,
+            session: Session
+    ) -> None:
+        facet = getattr(self.link_model, self.facet_field)
+        columns = [getattr(Content, field) for field in CATALOG_FIELDS]
+        session.execute(
+            self.model.__table__.insert().from_select(
+                ["content_id", self.facet_field, *CATALOG_FIELDS],
+                select(Content.id, facet, *columns)
+                .join(self.link_model, self.link_model.content_id == Content.id)
+            )
+        )
+
+    def facet_condition(self, facet_id: UUID) -> bool:
+        return getattr(self.model, self.facet_field) == facet_id
+
+
+class CatalogGenreRepository(CatalogRepository):
+
+    facet_field = "genre_id"
+    link_model = ContentGenre
+
+    def __init__(self) -> None:
+        super().__init__(CatalogGenre)
+
+
+class CatalogFranchiseRepository(CatalogRepository):
+
+    facet_field = "franchise_id"
+    link_model = ContentFranchise
+
+    def __init__(self) -> None:
+        super().__init__(CatalogFranchise)
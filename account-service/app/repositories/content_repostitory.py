@@ -1,8 +1,94 @@
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import func, literal, or_, update
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlmodel import Session, select
+from app.decorators.handlers import exception_handler
 from app.models import Content
 from app.repositories.base_repository import BaseRepository
+from app.utils.builders import build_offset_cursor, parse_offset_cursor
+from app.utils.settings import get_settings
+from app.utils.wrappers import PageWrapper
+
+settings = get_settings()
 
 
 class ContentRepository(BaseRepository):
 
+    load_plan = {
+        "genres": "selectin",
+        "franchises": "selectin",
+    }
+    conflict_fields = ["upload_id"]
+
     def __init__(self) -> None:
         super().__init__(Content)
+
+    def search_config(self):
+        return literal(settings.search_config, REGCONFIG)
+
+    def search_document(self):
+        config = self.search_config()
+        return func.setweight(func.to_tsvector(config, Content.title), "A").op("||")(
+            func.setweight(func.to_tsvector(config, Content.description), "B")
+        )
+
+    @exception_handler
+    def index_search(
+            self,
+            ids: list[UUID],
+            session: Session
+    ) -> None:
+        if not ids or session.get_bind().dialect.name != "postgresql":
+            return
+
+        session.execute(
+            update(Content)
+            .where(Content.id.in_(ids))
+            .values(search_vector=self.search_document())
+            .execution_options(synchronize_session=False)
+        )
+
+    @exception_handler
+    def search(
+            self,
+            text: str,
+            session: Session,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        text = (text or "").strip()
+        if not text:
+            raise ValueError("Search text must not be empty")
+
+        limit = min(limit or settings.page_size, settings.max_page_size)
+        if limit < 1:
+            raise ValueError(f"Invalid page size: {limit}")
+        offset = parse_offset_cursor(cursor) if cursor else 0
+
+        # Both predicates are served by their own GIN index and combined
+        # with a BitmapOr, so only matching rows are ranked.
+        query = func.websearch_to_tsquery(self.search_config(), text)
+        rank = (
+            func.ts_rank_cd(Content.search_vector, query)
+            + func.similarity(Content.title, text)
+        )
+        stmt = (
+            select(Content)
+            .options(*self.query_options(True, fields))
+            .where(or_(
+                Content.search_vector.op("@@")(query),
+                Content.title.op("%")(text)
+            ))
+            .order_by(rank.desc(), Content.id)
+            .offset(offset)
+            .limit(limit + 1)
+        )
+
+        data = list(session.exec(stmt).unique())
+        next_cursor = None
+        if len(data) > limit:
+            data = data[:limit]
+            next_cursor = build_offset_cursor(offset + limit)
+        return PageWrapper[Content](data, next_cursor)
@@ -4,5 +4,15 @@ from app.repositories.base_repository import BaseRepository
 
 class UserRepository(BaseRepository):
 
+    load_plan = {
+        "auth": "joined",
+        "subscription": "joined",
+        "devices": "selectin",
+    }
+    shallow_load_plan = {
+        "auth": "joined",
+        "subscription": "joined",
+    }
+
     def __init__(self) -> None:
         super().__init__(User)
@@ -4,6 +4,8 @@ from app.repositories.base_repository import BaseRepository
 
 class WatchHistoryRepository(BaseRepository):
 
+    cursor_field = "watched_at"
+
     def __init__(self) -> None:
         super().__init__(WatchHistory)
         
\ No newline at end of file
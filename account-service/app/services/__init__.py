@@ -6,8 +6,11 @@ from .content_franchise_service import ContentFranchiseService
 from .content_genre_service import ContentGenreService
 from .watch_history_service import WatchHistoryService
 from .subscription_plan_service import SubscriptionPlanService
+from .catalog_service import CatalogService
 from .content_service import ContentService
 from .user_service import UserService
+from .async_content_service import AsyncContentService
+from .async_subscription_plan_service import AsyncSubscriptionPlanService
 
 
 __all__ = [
@@ -15,10 +18,13 @@ __all__ = [
     "FranchiseService",
     "GenreService",
     "DeviceService",
+    "CatalogService",
     "ContentService",
     "UserService",
     "ContentFranchiseService",
     "ContentGenreService",
     "WatchHistoryService",
-    "SubscriptionPlanService"
+    "SubscriptionPlanService",
+    "AsyncContentService",
+    "AsyncSubscriptionPlanService"
 ]
@@ -0,0 +1,46 @@
+from typing import AsyncIterator, Optional
+from uuid import UUID
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import Content
+from app.repositories.async_content_repository import AsyncContentRepository
+from app.utils.wrappers import PageWrapper
+
+
+class AsyncContentService:
+
+    def __init__(
+            self,
+            repository: AsyncContentRepository = AsyncContentRepository()
+    ) -> None:
+        self.repository = repository
+
+    async def get_contents(
+            self,
+            session: AsyncSession,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        result = await self.repository.paginate(
+            session,
+            cursor=cursor,
+            limit=limit,
+            fields=fields
+        )
+        return result
+
+    def stream_contents(
+            self,
+            session: AsyncSession,
+            fields: Optional[frozenset] = None
+    ) -> AsyncIterator[Content]:
+        result = self.repository.stream(session, fields=fields)
+        return result
+
+    async def get_content(
+            self,
+            content_id: UUID,
+            session: AsyncSession
+    ) -> Content:
+        result = await self.repository.get(content_id, session)
+        return result
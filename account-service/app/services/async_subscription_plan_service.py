@@ -0,0 +1,40 @@
+from uuid import UUID
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models import SubscriptionPlan
+from app.repositories.async_subscription_plan_repository import AsyncSubscriptionPlanRepository
+from app.utils.wrappers import ListWrapper
+
+
+class AsyncSubscriptionPlanService:
+
+    def __init__(
+            self,
+            repository: AsyncSubscriptionPlanRepository = AsyncSubscriptionPlanRepository()
+    ) -> None:
+        self.repository = repository
+
+    async def get_plans(
+            self,
+            session: AsyncSession
+    ) -> ListWrapper:
+        result = await self.repository.select(session)
+        return result
+
+    async def get_plan(
+            self,
+            plan_id: UUID,
+            session: AsyncSession
+    ) -> SubscriptionPlan:
+        result = await self.repository.get(plan_id, session)
+        return result
+
+    async def get_one_plan(
+            self,
+            value: str,
+            session: AsyncSession
+    ) -> SubscriptionPlan:
+        result = await self.repository.get_one(
+            SubscriptionPlan.plan_name == value,
+            session
+        )
+        return result
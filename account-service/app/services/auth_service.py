@@ -1,10 +1,14 @@
 from re import match
 from uuid import UUID
-import bcrypt
 from sqlmodel import Session
 from app.abstract import AbstractAuthImpl
 from app.models import Auth
-from app.exceptions.exceptions import NotFoundException, PasswordMismatchException
+from app.config.bcrypt_config import hash_password, needs_rehash, verify_password
+from app.exceptions.exceptions import (
+    NotFoundException,
+    PasswordMismatchException,
+    ServerBusyException
+)
 from app.repositories.auth_repository import AuthRepository
 from app.utils.wrappers import ListWrapper
 
@@ -69,13 +73,27 @@ class AuthService(AbstractAuthImpl):
         else:
             auth = self.get_auth_by_username(username, session)
 
-        if not bcrypt.checkpw(
-                password.encode("utf-8"),
-                auth.password.encode("utf-8")
-        ):
+        if not verify_password(password, auth.password):
             raise PasswordMismatchException("Incorrect Password")
+
+        if needs_rehash(auth.password):
+            self.rehash_password(auth, password, session)
         return auth
 
+    def rehash_password(
+            self,
+            auth: Auth,
+            password: str,
+            session: Session
+    ) -> None:
+        try:
+            auth.password = hash_password(password)
+        except ServerBusyException:
+            return
+        session.add(auth)
+        session.commit()
+        session.refresh(auth)
+
     def create_auth(
             self,
             data: dict,
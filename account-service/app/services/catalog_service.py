@@ -0,0 +1,94 @@
+from typing import Optional
+from uuid import UUID
+from sqlmodel import Session
+from app.abstract import AbstractCatalogImpl
+from app.models import CatalogFranchise, CatalogGenre, Content
+from app.models.catalog_model import CATALOG_FIELDS
+from app.repositories.catalog_repository import (
+    CatalogFranchiseRepository,
+    CatalogGenreRepository,
+)
+from app.utils.wrappers import PageWrapper
+
+
+class CatalogService(AbstractCatalogImpl):
+
+    def __init__(
+            self,
+            genres: CatalogGenreRepository = CatalogGenreRepository(),
+            franchises: CatalogFranchiseRepository = CatalogFranchiseRepository()
+    ) -> None:
+        self.genres = genres
+        self.franchises = franchises
+
+    def add_contents(
+            self,
+            contents: list[Content],
+            genre_links: list[dict],
+            franchise_links: list[dict],
+            session: Session = None,
+            auto_commit: bool = True
+    ) -> None:
+        # Each link becomes one catalog row carrying a copy of the content's
+        # listing columns, so a browse page never joins back to content.
+        fields = {
+            content.id: {field: getattr(content, field) for field in CATALOG_FIELDS}
+            for content in contents
+        }
+        self.genres.create_many(
+            [CatalogGenre(**link, **fields[link["content_id"]]) for link in genre_links],
+            session,
+            False
+        )
+        self.franchises.create_many(
+            [CatalogFranchise(**link, **fields[link["content_id"]]) for link in franchise_links],
+            session,
+            False
+        )
+        if auto_commit:
+            session.commit()
+
+    def refresh_content(
+            self,
+            content: Content,
+            session: Session = None,
+            auto_commit: bool = True
+    ) -> None:
+        self.genres.refresh(content, session)
+        self.franchises.refresh(content, session)
+        if auto_commit:
+            session.commit()
+
+    def get_contents_by_genre(
+            self,
+            genre_id: UUID,
+            session: Session = None,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        result = self.genres.paginate(
+            session,
+            self.genres.facet_condition(genre_id),
+            cursor=cursor,
+            limit=limit,
+            fields=fields
+        )
+        return result
+
+    def get_contents_by_franchise(
+            self,
+            franchise_id: UUID,
+            session: Session = None,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        result = self.franchises.paginate(
+            session,
+            self.franchises.facet_condition(franchise_id),
+            cursor=cursor,
+            limit=limit,
+            fields=fields
+        )
+        return result
@@ -29,6 +29,16 @@ class ContentFranchiseService(AbstractContentFranchiseImpl):
         self.repository.create(franchise, session, auto_commit)
         return franchise
 
+    def create_franchises(
+            self,
+            data: list[dict],
+            session: Session = None,
+            auto_commit: bool = True
+    ) -> list[ContentFranchise]:
+        franchises = [ContentFranchise(**item) for item in data]
+        self.repository.create_many(franchises, session, auto_commit)
+        return franchises
+
     def get_franchises(
             self, 
             session: Session = None
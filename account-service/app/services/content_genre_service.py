@@ -28,6 +28,16 @@ class ContentGenreService(AbstractContentGenreImpl):
         self.service.create(genre, session, auto_commit)
         return genre
 
+    def create_genres(
+            self,
+            data: list[dict],
+            session: Session = None,
+            auto_commit: bool = True
+    ) -> list[ContentGenre]:
+        genres = [ContentGenre(**item) for item in data]
+        self.service.create_many(genres, session, auto_commit)
+        return genres
+
     def get_genres(
             self,
             session: Session = None
@@ -1,18 +1,22 @@
+from typing import Iterator, Optional
 from uuid import UUID
 from sqlmodel import Session
 from app.abstract import AbstractContentImpl
 from app.models import Content
 from app.repositories.content_repostitory import ContentRepository
-from app.utils.wrappers import ListWrapper
+from app.services.catalog_service import CatalogService
+from app.utils.wrappers import PageWrapper
 
 
 class ContentService(AbstractContentImpl):
 
     def __init__(
             self,
-            repository: ContentRepository = ContentRepository()
+            repository: ContentRepository = ContentRepository(),
+            catalog: CatalogService = CatalogService()
     ) -> None:
         self.repository = repository
+        self.catalog = catalog
 
     def create_content(
             self,
@@ -21,9 +25,27 @@ class ContentService(AbstractContentImpl):
             auto_commit: bool = True
     ) -> Content:
         content = Content(**data)
-        self.repository.create(content, session, auto_commit)
+        self.repository.create(content, session, False)
+        session.flush()
+        self.repository.index_search([content.id], session)
+        if auto_commit:
+            session.commit()
+            session.refresh(content)
         return content
 
+    def create_contents(
+            self,
+            data: list[dict],
+            session: Session = None,
+            auto_commit: bool = True
+    ) -> list[Content]:
+        contents = [Content(**item) for item in data]
+        result = self.repository.create_many(contents, session, False)
+        self.repository.index_search([content.id for content in result], session)
+        if auto_commit:
+            session.commit()
+        return result
+
     def update_content(
             self,
             content_id: UUID,
@@ -35,15 +57,55 @@ class ContentService(AbstractContentImpl):
             content_id,
             data,
             session,
-            auto_commit
+            False
         )
+        if result:
+            session.flush()
+            self.repository.index_search([result.id], session)
+            self.catalog.refresh_content(result, session, False)
+            if auto_commit:
+                session.commit()
+                session.refresh(result)
         return result
 
     def get_contents(
             self,
-            session: Session = None
-    ) -> ListWrapper:
-        result = self.repository.select(session)
+            session: Session = None,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        result = self.repository.paginate(
+            session,
+            cursor=cursor,
+            limit=limit,
+            fields=fields
+        )
+        return result
+
+    def search_contents(
+            self,
+            text: str,
+            session: Session = None,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        result = self.repository.search(
+            text,
+            session,
+            cursor=cursor,
+            limit=limit,
+            fields=fields
+        )
+        return result
+
+    def stream_contents(
+            self,
+            session: Session = None,
+            fields: Optional[frozenset] = None
+    ) -> Iterator[Content]:
+        result = self.repository.stream(session, fields=fields)
         return result
 
     def delete_content(
@@ -62,6 +62,18 @@ class FranchiseService(AbstractFranchiseImpl):
         result = self.repository.select(session)
         return result
 
+    @exception_handler
+    def get_franchises_by_ids(
+            self,
+            franchise_ids: list[UUID],
+            session: Session
+    ) -> ListWrapper:
+        result = self.repository.get_many(
+            Franchise.id.in_(franchise_ids),
+            session
+        )
+        return result
+
     @exception_handler
     def delete_franchise(
             self,
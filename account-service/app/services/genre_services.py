@@ -1,6 +1,7 @@
 from uuid import UUID
 from sqlmodel import Session
 from app.abstract import AbstractGenreImpl
+from app.config.cache_config import GENRES_KEY, cache
 from app.models import Genre, Genres
 from app.repositories.genre_repository import GenreRepository
 from app.utils.wrappers import ListWrapper
@@ -29,6 +30,7 @@ class GenreService(AbstractGenreImpl):
             session,
             auto_commit
         )
+        cache.invalidate_on_commit(session, GENRES_KEY)
         return genre
 
     def update_genre(
@@ -44,6 +46,7 @@ class GenreService(AbstractGenreImpl):
             session,
             auto_commit
         )
+        cache.invalidate_on_commit(session, GENRES_KEY)
         return result
 
     def get_genre(
@@ -61,6 +64,24 @@ class GenreService(AbstractGenreImpl):
         result = self.repository.select(session)
         return result
 
+    def get_genres_json(
+            self,
+            session: Session
+    ) -> bytes:
+        result = cache.get(
+            GENRES_KEY,
+            lambda: self.get_genres(session).to_json()
+        )
+        return result
+
+    def get_genres_by_ids(
+            self,
+            genre_ids: list[UUID],
+            session: Session
+    ) -> ListWrapper:
+        result = self.repository.get_many(Genre.id.in_(genre_ids), session)
+        return result
+
     def delete_genre(
             self,
             genre_id: UUID,
@@ -72,6 +93,7 @@ class GenreService(AbstractGenreImpl):
             session,
             auto_commit
         )
+        cache.invalidate_on_commit(session, GENRES_KEY)
         return result
 
     def get_content_by_genre(
@@ -1,6 +1,7 @@
 from uuid import UUID
 from sqlmodel import Session
 from app.abstract import AbstractSubscriptionPlanImpl
+from app.config.cache_config import PLANS_KEY, cache
 from app.models import SubscriptionPlan
 from app.repositories.subscription_plan_repository import SubscriptionPlanRepository
 from app.utils.wrappers import ListWrapper
@@ -26,6 +27,7 @@ class SubscriptionPlanService(AbstractSubscriptionPlanImpl):
             session,
             auto_commit
         )
+        cache.invalidate_on_commit(session, PLANS_KEY)
         return plan
 
     def get_plans(
@@ -35,6 +37,16 @@ class SubscriptionPlanService(AbstractSubscriptionPlanImpl):
         result = self.repository.select(session)
         return result
 
+    def get_plans_json(
+            self,
+            session: Session
+    ) -> bytes:
+        result = cache.get(
+            PLANS_KEY,
+            lambda: self.get_plans(session).to_json()
+        )
+        return result
+
     def get_plan(
             self,
             plan_id: UUID,
@@ -65,6 +77,7 @@ class SubscriptionPlanService(AbstractSubscriptionPlanImpl):
             session,
             auto_commit
         )
+        cache.invalidate_on_commit(session, PLANS_KEY)
         return result
 
     def update_plan(
@@ -80,4 +93,5 @@ class SubscriptionPlanService(AbstractSubscriptionPlanImpl):
             session,
             auto_commit
         )
+        cache.invalidate_on_commit(session, PLANS_KEY)
         return result
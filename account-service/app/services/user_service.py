@@ -1,9 +1,10 @@
+from typing import Iterator, Optional
 from uuid import UUID
 from sqlmodel import Session
 from app.abstract import AbstractUserImpl
 from app.models import User
 from app.repositories.user_repository import UserRepository
-from app.utils.wrappers import ListWrapper
+from app.utils.wrappers import PageWrapper
 
 
 class UserService(AbstractUserImpl):
@@ -30,9 +31,28 @@ class UserService(AbstractUserImpl):
 
     def get_users(
             self,
-            session: Session = None
-    ) -> ListWrapper:
-        result = self.repository.select(session)
+            session: Session = None,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> PageWrapper:
+        result = self.repository.paginate(
+            session,
+            cursor=cursor,
+            limit=limit,
+            deep=deep,
+            fields=fields
+        )
+        return result
+
+    def stream_users(
+            self,
+            session: Session = None,
+            deep: bool = True,
+            fields: Optional[frozenset] = None
+    ) -> Iterator[User]:
+        result = self.repository.stream(session, deep=deep, fields=fields)
         return result
 
     def get_user(
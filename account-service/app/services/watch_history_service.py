@@ -1,9 +1,10 @@
+from typing import Iterator, Optional
 from uuid import UUID
 from sqlmodel import Session
 from app.abstract import AbstractWatchHistoryImpl
 from app.models import WatchHistory
 from app.repositories.watch_history_repository import WatchHistoryRepository
-from app.utils.wrappers import ListWrapper
+from app.utils.wrappers import PageWrapper
 
 
 class WatchHistoryService(AbstractWatchHistoryImpl):
@@ -74,11 +75,26 @@ class WatchHistoryService(AbstractWatchHistoryImpl):
     def get_watch_histories(
             self,
             user_id: UUID,
-            session: Session
-    ) -> ListWrapper:
-        result = self.repository.get_many(
+            session: Session,
+            cursor: Optional[str] = None,
+            limit: Optional[int] = None
+    ) -> PageWrapper:
+        result = self.repository.paginate(
+            session,
             WatchHistory.user_id == user_id,
-            session
+            cursor,
+            limit
+        )
+        return result
+
+    def stream_watch_histories(
+            self,
+            user_id: UUID,
+            session: Session
+    ) -> Iterator[WatchHistory]:
+        result = self.repository.stream(
+            session,
+            WatchHistory.user_id == user_id
         )
         return result
 
@@ -1,3 +1,9 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from uuid import UUID
+from typing import Iterable, Optional
+from flask import Response, stream_with_context
 from app.utils.settings import get_settings
 from app.models.base_model import EntityBaseModel
 
@@ -17,8 +23,52 @@ def build_spring_url(*paths, proxy: bool = False) -> str:
     return base_url
 
 
+def build_json_response(body: bytes) -> Response:
+    return Response(body, mimetype="application/json")
+
+
+def build_stream_response(chunks: Iterable[bytes]) -> Response:
+    return Response(stream_with_context(chunks), mimetype="application/json")
+
+
 def serialize_objects(
     data: list[EntityBaseModel], 
     deep: bool
 ) -> list[dict]:
     return [obj.as_json(deep) for obj in data]
+
+
+def parse_fields(fields: Optional[str]) -> Optional[frozenset]:
+    if not fields:
+        return None
+    return frozenset(field.strip() for field in fields.split(",") if field.strip()) or None
+
+
+def build_cursor(position: datetime, _id: UUID) -> str:
+    raw = json.dumps([position.isoformat(), str(_id)])
+    return urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def build_offset_cursor(offset: int) -> str:
+    raw = json.dumps([offset])
+    return urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def parse_offset_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        offset, = json.loads(urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError
+        return offset
+    except Exception:
+        raise ValueError(f"Invalid cursor: '{cursor}'")
+
+
+def parse_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position, _id = json.loads(urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(position), UUID(_id)
+    except Exception:
+        raise ValueError(f"Invalid cursor: '{cursor}'")
@@ -0,0 +1,91 @@
+import hashlib
+import hmac
+import re
+import time
+import zlib
+from base64 import urlsafe_b64encode
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import quote
+from app.utils.settings import get_settings
+
+SAFE_FILE = re.compile(r"[A-Za-z0-9._~-]+")
+
+
+def sign_media(file: str, expires: int, key: bytes) -> str:
+    digest = hmac.new(key, f"{file}:{expires}".encode("utf-8"), hashlib.sha256).digest()
+    return urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+
+
+class MediaUrlResolver:
+
+    def __init__(
+            self,
+            base_urls: list[str],
+            signing_key: Optional[str] = None,
+            ttl: int = 3600
+    ) -> None:
+        if not base_urls:
+            raise ValueError("At least one media base URL is required")
+
+        bases = [url.strip().rstrip("/") for url in base_urls]
+        self.thumbnails = [f"{base}/thumbnails/" for base in bases]
+        self.streaming = [f"{base}/streaming/" for base in bases]
+        self.signing_key = signing_key.encode("utf-8") if signing_key else None
+        self.ttl = ttl
+
+    def shard(self, prefixes: list[str], file: str) -> str:
+        if len(prefixes) == 1:
+            return prefixes[0]
+        # The host depends only on the file, so each file keeps one URL and
+        # stays cached at a single edge.
+        return prefixes[zlib.crc32(file.encode("utf-8")) % len(prefixes)]
+
+    def expires(self) -> int:
+        if self.signing_key is None:
+            return 0
+        # Rounded to the TTL so every URL built in the same window is
+        # identical, which keeps serialized pages cacheable.
+        return (int(time.time()) // self.ttl + 2) * self.ttl
+
+    def build(
+            self,
+            prefixes: list[str],
+            file: Optional[str],
+            query: str,
+            expires: int
+    ) -> Optional[str]:
+        if not file:
+            return None
+
+        name = file if SAFE_FILE.fullmatch(file) else quote(file, safe="")
+        url = self.shard(prefixes, file) + name + query
+        if self.signing_key is None:
+            return url
+
+        token = sign_media(file, expires, self.signing_key)
+        return f"{url}{'&' if query else '?'}expires={expires}&token={token}"
+
+    def resolve(
+            self,
+            thumbnail_file: Optional[str],
+            content_file: Optional[str],
+            trailer_file: Optional[str]
+    ) -> dict:
+        expires = self.expires()
+        return {
+            "thumbnail_url": self.build(self.thumbnails, thumbnail_file, "", expires),
+            "content_url": self.build(self.streaming, content_file, "?source=movie", expires),
+            "trailer_url": self.build(self.streaming, trailer_file, "?source=trailer", expires),
+        }
+
+
+@lru_cache
+def get_media_resolver() -> MediaUrlResolver:
+    settings = get_settings()
+    base_urls = settings.media_base_urls or settings.spring_internal_url
+    return MediaUrlResolver(
+        base_urls.split(","),
+        settings.media_signing_key,
+        settings.media_url_ttl
+    )
@@ -0,0 +1,140 @@
+from functools import lru_cache
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Type
+from pydantic_core import to_json
+from app.models.base_model import EntityBaseModel
+
+
+class ModelSerializer:
+
+    def __init__(self, model: Type[EntityBaseModel]) -> None:
+        self.model = model
+        self.schema = model.__pydantic_serializer__
+        self.exclude = None
+        self.compiled = False
+
+    def compile(self, obj: EntityBaseModel) -> None:
+        self.exclude = obj.hide_fields()
+        self.compiled = True
+
+    def dump(self, obj: EntityBaseModel, deep: bool = True) -> bytes:
+        if not self.compiled:
+            self.compile(obj)
+
+        body = self.schema.to_json(obj, exclude=self.exclude, by_alias=False)
+        return merge_extra(body, obj.extra_fields(deep))
+
+
+class SparseSerializer(ModelSerializer):
+
+    def __init__(self, model: Type[EntityBaseModel], fields: frozenset) -> None:
+        super().__init__(model)
+        self.fields = fields
+        self.extras = fields & model.extra_sources.keys()
+        self.include = None
+
+    def compile(self, obj: EntityBaseModel) -> None:
+        super().compile(obj)
+        # Hidden columns stay hidden even when they are asked for.
+        self.include = (self.fields - self.extras) - (self.exclude or set())
+
+    def dump(self, obj: EntityBaseModel, deep: bool = True) -> bytes:
+        if not self.compiled:
+            self.compile(obj)
+
+        body = self.schema.to_json(obj, include=self.include, by_alias=False)
+        if not self.extras:
+            return body
+        return merge_extra(body, obj.sparse_extra_fields(self.extras))
+
+
+_registry: dict[type, ModelSerializer] = {}
+
+
+def get_serializer(
+    model: Type[EntityBaseModel],
+    fields: Optional[frozenset] = None
+) -> ModelSerializer:
+    if fields:
+        return get_sparse_serializer(model, fields)
+
+    serializer = _registry.get(model)
+    if serializer is None:
+        serializer = _registry.setdefault(model, ModelSerializer(model))
+    return serializer
+
+
+@lru_cache(maxsize=256)
+def get_sparse_serializer(
+    model: Type[EntityBaseModel],
+    fields: frozenset
+) -> SparseSerializer:
+    return SparseSerializer(model, fields)
+
+
+def merge_extra(body: bytes, extra: dict) -> bytes:
+    if not extra:
+        return body
+
+    parts = [body[:-1]]
+    separator = b"," if len(body) > 2 else b""
+    for key, value in extra.items():
+        parts.append(separator + to_json(key) + b":" + encode_value(value))
+        separator = b","
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+def encode_value(value: Any) -> bytes:
+    if isinstance(value, EntityBaseModel):
+        return get_serializer(type(value)).dump(value)
+    if isinstance(value, list):
+        return b"[" + b",".join(encode_value(item) for item in value) + b"]"
+    return to_json(value)
+
+
+def serialize_json(
+    data: Iterable[EntityBaseModel],
+    deep: bool = True,
+    fields: Optional[frozenset] = None
+) -> bytes:
+    return b"[" + b",".join(
+        get_serializer(type(obj), fields).dump(obj, deep) for obj in data
+    ) + b"]"
+
+
+def stream_json(
+    data: Iterable[EntityBaseModel],
+    deep: bool = True,
+    chunk_size: int = 64 * 1024,
+    fields: Optional[frozenset] = None
+) -> Iterator[bytes]:
+    buffer = bytearray(b"[")
+    separator = b""
+    for obj in data:
+        buffer += separator
+        buffer += get_serializer(type(obj), fields).dump(obj, deep)
+        separator = b","
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
+
+
+async def stream_json_async(
+    data: AsyncIterable[EntityBaseModel],
+    deep: bool = True,
+    chunk_size: int = 64 * 1024,
+    fields: Optional[frozenset] = None
+) -> AsyncIterator[bytes]:
+    buffer = bytearray(b"[")
+    separator = b""
+    async for obj in data:
+        buffer += separator
+        buffer += get_serializer(type(obj), fields).dump(obj, deep)
+        separator = b","
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
@@ -1,4 +1,4 @@
-from typing import Self
+from typing import Literal, Optional, Self
 from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import PostgresDsn, RedisDsn, Field, model_validator
@@ -8,12 +8,82 @@ class Settings(BaseSettings):
     spring_internal_url: str = Field(alias="SPRING_INTERNAL_URL")
     spring_local_url: str = Field(alias="SPRING_LOCAL_URL")
     spring_proxy_prefix: str = Field(alias="SPRING_PROXY_PREFIX")
+
+    media_base_urls: Optional[str] = Field(default=None, alias="MEDIA_BASE_URLS")
+    media_signing_key: Optional[str] = Field(default=None, alias="MEDIA_SIGNING_KEY")
+    media_url_ttl: int = Field(default=3600, alias="MEDIA_URL_TTL")
     
     postgres_internal_url: PostgresDsn = Field(alias="POSTGRES_INTERNAL_URL")
     postgres_local_url: PostgresDsn = Field(alias="POSTGRES_LOCAL_URL")
     
     redis_internal_url: RedisDsn = Field(alias="REDIS_INTERNAL_URL")
     redis_local_url: RedisDsn = Field(alias="REDIS_LOCAL_URL")
+
+    redis_max_connections: int = Field(default=50, alias="REDIS_MAX_CONNECTIONS")
+    redis_pool_timeout: int = Field(default=20, alias="REDIS_POOL_TIMEOUT")
+    redis_health_check_interval: int = Field(default=30, alias="REDIS_HEALTH_CHECK_INTERVAL")
+    redis_connect_timeout: int = Field(default=5, alias="REDIS_CONNECT_TIMEOUT")
+    redis_request_timeout: float = Field(default=0.25, alias="REDIS_REQUEST_TIMEOUT")
+    redis_retry_after: int = Field(default=15, alias="REDIS_RETRY_AFTER")
+
+    cache_local_ttl: int = Field(default=30, alias="CACHE_LOCAL_TTL")
+    cache_local_size: int = Field(default=128, alias="CACHE_LOCAL_SIZE")
+    cache_redis: bool = Field(default=False, alias="CACHE_REDIS")
+    cache_redis_ttl: int = Field(default=3600, alias="CACHE_REDIS_TTL")
+
+    db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(default=30, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    db_statement_timeout: int = Field(default=30000, alias="DB_STATEMENT_TIMEOUT")
+    db_pgbouncer: bool = Field(default=False, alias="DB_PGBOUNCER")
+
+    web_bind: str = Field(default="0.0.0.0:5000", alias="WEB_BIND")
+    web_worker_class: Literal["sync", "gthread", "gevent"] = Field(default="gthread", alias="WEB_WORKER_CLASS")
+    web_workers: int = Field(default=0, alias="WEB_CONCURRENCY")
+    web_threads: int = Field(default=4, alias="WEB_THREADS")
+    web_worker_connections: int = Field(default=100, alias="WEB_WORKER_CONNECTIONS")
+    web_max_requests: int = Field(default=2000, alias="WEB_MAX_REQUESTS")
+    web_max_requests_jitter: int = Field(default=200, alias="WEB_MAX_REQUESTS_JITTER")
+    web_keepalive: int = Field(default=75, alias="WEB_KEEPALIVE")
+    web_timeout: int = Field(default=60, alias="WEB_TIMEOUT")
+    web_graceful_timeout: int = Field(default=30, alias="WEB_GRACEFUL_TIMEOUT")
+
+    bcrypt_rounds: int = Field(default=12, alias="BCRYPT_ROUNDS")
+    # Hashing processes for the whole host, shared out across the gunicorn
+    # workers with at least one each. 0 means one per CPU.
+    bcrypt_workers: int = Field(default=0, alias="BCRYPT_WORKERS")
+    bcrypt_max_pending: int = Field(default=16, alias="BCRYPT_MAX_PENDING")
+    bcrypt_timeout: int = Field(default=10, alias="BCRYPT_TIMEOUT")
+
+    worker_consumers: int = Field(default=1, alias="WORKER_CONSUMERS")
+    worker_mode: Literal["thread", "process"] = Field(default="thread", alias="WORKER_MODE")
+    worker_poll_timeout: int = Field(default=1, alias="WORKER_POLL_TIMEOUT")
+    worker_drain_timeout: int = Field(default=30, alias="WORKER_DRAIN_TIMEOUT")
+    worker_stream: str = Field(default="spring:content:upload:events", alias="WORKER_STREAM")
+    worker_group: str = Field(default="flask-workers", alias="WORKER_GROUP")
+    worker_claim_idle: int = Field(default=60000, alias="WORKER_CLAIM_IDLE")
+    worker_claim_interval: int = Field(default=30, alias="WORKER_CLAIM_INTERVAL")
+    worker_claim_count: int = Field(default=10, alias="WORKER_CLAIM_COUNT")
+    worker_trim_interval: int = Field(default=60, alias="WORKER_TRIM_INTERVAL")
+    worker_stream_warn_length: int = Field(default=100000, alias="WORKER_STREAM_WARN_LENGTH")
+    worker_batch_size: int = Field(default=1, alias="WORKER_BATCH_SIZE")
+    worker_batch_wait: int = Field(default=200, alias="WORKER_BATCH_WAIT")
+    worker_retry_limit: int = Field(default=5, alias="WORKER_RETRY_LIMIT")
+    worker_retry_base: float = Field(default=2.0, alias="WORKER_RETRY_BASE")
+    worker_retry_max_delay: float = Field(default=300.0, alias="WORKER_RETRY_MAX_DELAY")
+    worker_error_backoff: int = Field(default=30, alias="WORKER_ERROR_BACKOFF")
+    worker_async_concurrency: int = Field(default=100, alias="WORKER_ASYNC_CONCURRENCY")
+    worker_async_read_count: int = Field(default=10, alias="WORKER_ASYNC_READ_COUNT")
+    worker_metrics_port: int = Field(default=9100, alias="WORKER_METRICS_PORT")
+    worker_metrics_addr: str = Field(default="0.0.0.0", alias="WORKER_METRICS_ADDR")
+    worker_metrics_interval: int = Field(default=15, alias="WORKER_METRICS_INTERVAL")
+
+    page_size: int = Field(default=50, alias="PAGE_SIZE")
+    max_page_size: int = Field(default=500, alias="MAX_PAGE_SIZE")
+    stream_batch_size: int = Field(default=500, alias="STREAM_BATCH_SIZE")
+    search_config: str = Field(default="simple", alias="SEARCH_CONFIG")
     
     @model_validator(mode="after")
     def parse_urls(self) -> Self:
@@ -1,6 +1,7 @@
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 from app.models import EntityBaseModel
 from app.utils.builders import serialize_objects
+from app.utils.serializers import serialize_json
 
 T = TypeVar("T", bound=EntityBaseModel)
 
@@ -12,4 +13,18 @@ class ListWrapper(Generic[T]):
         
     def serialize(self, deep: bool = True) -> list[dict]:
         return serialize_objects(self.items, deep)
-    
\ No newline at end of file
+
+    def to_json(self, deep: bool = True, fields: Optional[frozenset] = None) -> bytes:
+        return serialize_json(self.items, deep, fields)
+
+
+class PageWrapper(ListWrapper[T]):
+
+    def __init__(self, items: list[T], next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+    def headers(self) -> dict:
+        if self.next_cursor:
+            return {"X-Next-Cursor": self.next_cursor}
+        return {}
@@ -62,10 +62,15 @@ def delete_franchise(franchise_id) -> Response:
 
 @admin_bl.route("/media", methods=["GET"])
 def media_view() -> str:
-    contents = content_service.get_contents(db())
+    contents = content_service.get_contents(
+        db(),
+        request.args.get("cursor"),
+        request.args.get("limit", type=int)
+    )
     return render_template(
         "content_view.html", 
-        data=contents.serialize()
+        data=contents.serialize(),
+        next_cursor=contents.next_cursor
     )
 
 
@@ -98,10 +103,16 @@ def delete_media(content_id) -> Response:
 
 @admin_bl.route("/users", methods=["GET"])
 def users_view() -> str:
-    users = user_services.get_users(db())
+    users = user_services.get_users(
+        db(),
+        request.args.get("cursor"),
+        request.args.get("limit", type=int),
+        deep=False
+    )
     return render_template(
         "users_view.html",
-        data=users.serialize(deep=False)
+        data=users.serialize(deep=False),
+        next_cursor=users.next_cursor
     )
 
 
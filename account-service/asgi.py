@@ -0,0 +1,33 @@
+from contextlib import asynccontextmanager
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Mount
+from app.api.asgi import routes
+from app.api.asgi.responses import json_response
+from app.config.async_sqlmodel_config import dispose_async_engine
+from app.exceptions.exceptions import BaseExceptionError
+from pydantic_core import to_json
+from main import app as flask_app
+
+
+async def handle_errors(request: Request, error: BaseExceptionError) -> Response:
+    return json_response(to_json(error.to_dict()), error.http_code)
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    yield
+    await dispose_async_engine()
+
+
+app = Starlette(
+    routes=[
+        *routes,
+        Mount("/", app=WSGIMiddleware(flask_app))
+    ],
+    exception_handlers={BaseExceptionError: handle_errors},
+    lifespan=lifespan
+)
+app.state.jwt_secret_key = flask_app.config["JWT_SECRET_KEY"]
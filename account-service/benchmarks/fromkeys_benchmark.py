@@ -0,0 +1,49 @@
+import os
+import sys
+from datetime import date
+from timeit import timeit
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import TypeAdapter
+from app.models import User, WatchHistory
+
+PAYLOADS = {
+    User: {
+        "first_name": "Brandon",
+        "last_name": "Bold",
+        "birth_date": "1999-04-12",
+        "last_login": "2025-07-20T19:32:06",
+    },
+    WatchHistory: {
+        "watched_at": "2025-07-20T19:32:06",
+        "last_position": 1834.5,
+    },
+}
+
+
+def build(model):
+    if model is User:
+        return User(first_name="a", last_name="b", birth_date=date.today())
+    return WatchHistory(user_id=uuid4(), content_id=uuid4())
+
+
+def uncached_fromkeys(obj, **kwargs) -> None:
+    fields_info = obj._meta_fields()
+    for key, value in kwargs.items():
+        checked = TypeAdapter(fields_info[key].annotation).validate_python(value)
+        setattr(obj, key, checked)
+
+
+if __name__ == "__main__":
+    number = 2000
+
+    for model, payload in PAYLOADS.items():
+        obj = build(model)
+        before = timeit(lambda: uncached_fromkeys(obj, **payload), number=number)
+        after = timeit(lambda: obj.fromkeys(**payload), number=number)
+        print(f"{model.__name__:<14} "
+              f"before: {before / number * 1e6:8.1f} us/update   "
+              f"after: {after / number * 1e6:8.1f} us/update   "
+              f"x{before / after:.1f}")
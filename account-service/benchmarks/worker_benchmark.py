@@ -0,0 +1,193 @@
+"""Compare gunicorn worker classes on /media/ and /auth/login.
+
+    python benchmarks/worker_benchmark.py matrix --username bench --password secret
+    python benchmarks/worker_benchmark.py load http://127.0.0.1:5000/media/ --token ...
+
+`matrix` starts gunicorn from gunicorn.conf.py once per WEB_WORKER_CLASS,
+logs in to get a token, then drives both endpoints with a closed loop of
+clients and prints one row per class and endpoint. `load` drives a single
+URL against a server that is already running. See benchmarks/README.md
+for the methodology and recorded results.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import requests
+
+SERVICE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKER_CLASSES = ["sync", "gthread", "gevent"]
+
+
+def run_client(method, url, body, headers, deadline, latencies, errors, lock) -> None:
+    session = requests.Session()
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = session.request(method, url, data=body,
+                                       headers=headers, timeout=30)
+            ok = response.status_code < 400
+        except requests.RequestException:
+            ok = False
+        elapsed = time.perf_counter() - started
+
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors.append(elapsed)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(len(values) * pct / 100))
+    return values[index]
+
+
+def load(method, url, payload=None, token=None, concurrency=16, duration=20.0) -> dict:
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    body = json.dumps(payload) if payload is not None else None
+
+    latencies, errors, lock = [], [], threading.Lock()
+    deadline = time.perf_counter() + duration
+    clients = [
+        threading.Thread(target=run_client,
+                         args=(method, url, body, headers, deadline,
+                               latencies, errors, lock))
+        for _ in range(concurrency)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / duration,
+        "p50": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95": percentile(latencies, 95) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+    }
+
+
+def start_server(worker_class: str, args) -> subprocess.Popen:
+    env = {**os.environ, "WEB_WORKER_CLASS": worker_class, "WEB_BIND": args.bind}
+    if args.workers:
+        env["WEB_CONCURRENCY"] = str(args.workers)
+    command = [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py"]
+    if args.app:
+        command.append(args.app)
+    return subprocess.Popen(command, cwd=SERVICE_ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_until_ready(base_url: str, server: subprocess.Popen, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with status {server.returncode}")
+        try:
+            requests.get(f"{base_url}/health/db", timeout=2)
+            return
+        except requests.RequestException:
+            time.sleep(0.5)
+    raise RuntimeError("gunicorn did not start in time")
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    server.terminate()
+    try:
+        server.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def run_matrix(args) -> None:
+    base_url = f"http://{args.bind}"
+    credentials = {"username": args.username, "password": args.password}
+    rows = []
+
+    for worker_class in args.classes:
+        server = start_server(worker_class, args)
+        try:
+            wait_until_ready(base_url, server)
+            response = requests.post(f"{base_url}/auth/login", json=credentials, timeout=30)
+            response.raise_for_status()
+            token = response.json()["access_token"]
+
+            scenarios = [
+                ("/media/", "GET", f"{base_url}/media/?limit={args.limit}", None, token),
+                ("/auth/login", "POST", f"{base_url}/auth/login", credentials, None),
+            ]
+            for name, method, url, payload, scenario_token in scenarios:
+                result = load(method, url, payload, scenario_token,
+                              args.concurrency, args.duration)
+                rows.append((worker_class, name, result))
+                print(f"{worker_class:<8} {name:<12} {result['rps']:7.1f} rps  "
+                      f"p50 {result['p50']:7.1f}ms  p99 {result['p99']:7.1f}ms  "
+                      f"errors {result['errors']}", file=sys.stderr)
+        finally:
+            stop_server(server)
+
+    print("| worker class | endpoint | rps | p50 ms | p95 ms | p99 ms | errors |")
+    print("|---|---|---|---|---|---|---|")
+    for worker_class, name, result in rows:
+        print(f"| {worker_class} | {name} | {result['rps']:.1f} | {result['p50']:.1f} "
+              f"| {result['p95']:.1f} | {result['p99']:.1f} | {result['errors']} |")
+
+
+def run_load(args) -> None:
+    result = load(args.method, args.url, args.json, args.token,
+                  args.concurrency, args.duration)
+    print(f"requests: {result['requests']}  errors: {result['errors']}  "
+          f"rps: {result['rps']:.1f}")
+    if result["requests"]:
+        print(f"p50: {result['p50']:.1f}ms  p95: {result['p95']:.1f}ms  "
+              f"p99: {result['p99']:.1f}ms")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Closed-loop HTTP load generator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text in [
+        ("matrix", "Start gunicorn per worker class and benchmark /media/ and /auth/login"),
+        ("load", "Drive a single URL on a running server"),
+    ]:
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--concurrency", type=int, default=16)
+        command.add_argument("--duration", type=float, default=20.0)
+
+    matrix = commands.choices["matrix"]
+    matrix.add_argument("--username", required=True)
+    matrix.add_argument("--password", required=True)
+    matrix.add_argument("--classes", nargs="+", choices=WORKER_CLASSES, default=WORKER_CLASSES)
+    matrix.add_argument("--workers", type=int, default=None, help="WEB_CONCURRENCY for every run")
+    matrix.add_argument("--bind", default="127.0.0.1:5055")
+    matrix.add_argument("--limit", type=int, default=50, help="Page size for /media/")
+    matrix.add_argument("--app", default=None, help="WSGI app overriding main:app")
+
+    single = commands.choices["load"]
+    single.add_argument("url")
+    single.add_argument("--method", default="GET")
+    single.add_argument("--json", type=json.loads, default=None)
+    single.add_argument("--token", default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.command == "matrix":
+        run_matrix(args)
+    else:
+        run_load(args)
@@ -69,13 +69,20 @@ CREATE TABLE content (
     thumbnail_file VARCHAR NOT NULL,
     content_file VARCHAR NOT NULL,
     trailer_file VARCHAR,
+    upload_id VARCHAR UNIQUE,
     created_at TIMESTAMP NOT NULL,
     updated_at TIMESTAMP,
+    search_vector TSVECTOR,
     episode_number INT,
     season_id UUID,
     FOREIGN KEY (season_id) REFERENCES season (id)
 );
 
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX ix_content_search_vector ON content USING gin (search_vector);
+CREATE INDEX ix_content_title_trgm ON content USING gin (title gin_trgm_ops);
+
 CREATE TABLE watch_history (
     id UUID PRIMARY KEY,
     user_id UUID NOT NULL,
@@ -108,4 +115,41 @@ CREATE TABLE content_franchise (
     PRIMARY KEY (content_id, franchise_id),
     FOREIGN KEY (content_id) REFERENCES content (id),
     FOREIGN KEY (franchise_id) REFERENCES franchise (id)
-);
\ No newline at end of file
+);
+CREATE TABLE catalog_genre (
+    content_id UUID NOT NULL,
+    genre_id UUID NOT NULL,
+    title VARCHAR NOT NULL,
+    description VARCHAR NOT NULL,
+    release_date DATE NOT NULL,
+    duration VARCHAR NOT NULL,
+    thumbnail_file VARCHAR NOT NULL,
+    content_file VARCHAR NOT NULL,
+    trailer_file VARCHAR,
+    created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (content_id, genre_id),
+    FOREIGN KEY (content_id) REFERENCES content (id) ON DELETE CASCADE,
+    FOREIGN KEY (genre_id) REFERENCES genre (id) ON DELETE CASCADE
+);
+
+CREATE INDEX ix_catalog_genre_release_date
+    ON catalog_genre (genre_id, release_date DESC, content_id DESC);
+
+CREATE TABLE catalog_franchise (
+    content_id UUID NOT NULL,
+    franchise_id UUID NOT NULL,
+    title VARCHAR NOT NULL,
+    description VARCHAR NOT NULL,
+    release_date DATE NOT NULL,
+    duration VARCHAR NOT NULL,
+    thumbnail_file VARCHAR NOT NULL,
+    content_file VARCHAR NOT NULL,
+    trailer_file VARCHAR,
+    created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (content_id, franchise_id),
+    FOREIGN KEY (content_id) REFERENCES content (id) ON DELETE CASCADE,
+    FOREIGN KEY (franchise_id) REFERENCES franchise (id) ON DELETE CASCADE
+);
+
+CREATE INDEX ix_catalog_franchise_release_date
+    ON catalog_franchise (franchise_id, release_date DESC, content_id DESC);
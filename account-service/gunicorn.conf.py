@@ -0,0 +1,47 @@
+import multiprocessing
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.settings import get_settings
+
+settings = get_settings()
+
+wsgi_app = "main:app"
+bind = settings.web_bind
+worker_class = settings.web_worker_class
+workers = settings.web_workers or multiprocessing.cpu_count() * 2 + 1
+threads = settings.web_threads if worker_class == "gthread" else 1
+worker_connections = settings.web_worker_connections
+
+preload_app = True
+max_requests = settings.web_max_requests
+max_requests_jitter = settings.web_max_requests_jitter
+
+# nginx keeps idle upstream connections open for up to 60s, so the worker
+# must hold them a little longer or nginx will reuse a socket gunicorn closed.
+keepalive = settings.web_keepalive
+timeout = settings.web_timeout
+graceful_timeout = settings.web_graceful_timeout
+
+forwarded_allow_ips = "*"
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    if worker_class == "gevent":
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+
+    from app.config.sqlmodel_config import dispose_engine
+    dispose_engine(close=False)
+
+    from app.config.redis_config import dispose_redis
+    dispose_redis()
+
+
+def worker_exit(server, worker):
+    from app.config.bcrypt_config import shutdown_executor
+    shutdown_executor()
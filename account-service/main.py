@@ -3,6 +3,7 @@ from app.api.v1 import admin_bl
 from app.api.v1 import content_bl
 from app.api.v1 import device_bl
 from app.api.v1 import genre_bl
+from app.api.v1 import health_bl
 from app.api.v1 import auth_bl
 from app.api.v1 import user_bl
 from app.api.v1 import subscription_plan_bl
@@ -13,6 +14,7 @@ from app.exceptions.exceptions import (
     ExpiredTokenException,
     NotFoundTokenException
 )
+from app.config.bootstrap import bootstrap_schema
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 
@@ -20,8 +22,10 @@ app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 7 * 1024 * 1024 * 1024
 app.config["SECRET_KEY"] = "my_secret"
 app.config["JWT_SECRET_KEY"] = app.config["SECRET_KEY"]
+# Lets browsers read the pagination cursor and the ETag for revalidation.
+EXPOSE_HEADERS = ["X-Next-Cursor", "ETag"]
 
-CORS(app)
+CORS(app, expose_headers=EXPOSE_HEADERS)
 jwt = JWTManager(app)
 
 
@@ -48,6 +52,11 @@ def missing_token_cb(error) -> tuple[Response, int]:
     return jsonify(exc.to_dict()), exc.http_code
 
 
+@app.cli.command("bootstrap-db")
+def bootstrap_db() -> None:
+    bootstrap_schema()
+
+
 @app.teardown_appcontext
 def remove_session(exception=None):
     session = g.pop("session", None)
@@ -55,15 +64,15 @@ def remove_session(exception=None):
         session.close()
 
 
-CORS(admin_bl)
-CORS(content_bl)
-CORS(genre_bl)
-CORS(auth_bl)
-CORS(user_bl)
-CORS(subscription_plan_bl)
+CORS(admin_bl, expose_headers=EXPOSE_HEADERS)
+CORS(content_bl, expose_headers=EXPOSE_HEADERS)
+CORS(genre_bl, expose_headers=EXPOSE_HEADERS)
+CORS(auth_bl, expose_headers=EXPOSE_HEADERS)
+CORS(user_bl, expose_headers=EXPOSE_HEADERS)
+CORS(subscription_plan_bl, expose_headers=EXPOSE_HEADERS)
 
-CORS(device_bl)
-CORS(watch_bl)
+CORS(device_bl, expose_headers=EXPOSE_HEADERS)
+CORS(watch_bl, expose_headers=EXPOSE_HEADERS)
 
 user_bl.register_blueprint(device_bl)
 user_bl.register_blueprint(watch_bl)
@@ -74,6 +83,7 @@ app.register_blueprint(genre_bl)
 app.register_blueprint(auth_bl)
 app.register_blueprint(user_bl)
 app.register_blueprint(subscription_plan_bl)
+app.register_blueprint(health_bl)
 
 
 if __name__ == "__main__":
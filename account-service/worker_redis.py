@@ -1,8 +1,29 @@
+import argparse
 import json
+import os
+import random
 import redis
 import logging
 import signal
+import socket
+import threading
+import time
+from multiprocessing import get_context
+from datetime import datetime
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlmodel import Session
+from app.config.redis_config import get_redis, pipeline
 from app.config.sqlmodel_config import create_session
+from app.config.metrics_config import (
+    event_latency,
+    event_processing,
+    events_failed,
+    events_processed,
+    events_rolled_back,
+    queue_length,
+    start_metrics_server,
+)
+from app.exceptions.exceptions import DataValidationException, DuplicatedRecordException
 from app.utils.settings import get_settings
 from app.orchestrators import ContentOrchestrator
 from app.dtos import CreateContentDto
@@ -10,60 +31,562 @@ from app.dtos import CreateContentDto
 settings = get_settings()
 logger = logging.getLogger("worker")
 
+ROLLBACK_KEY = "flask:metadata:save:rollback"
+RETRY_KEY = "flask:content:upload:retry"
+DEAD_LETTER_KEY = "flask:content:upload:dead"
+
+# Moving an event between keys takes two commands; running both in one
+# script means a failure in between can no longer lose the event.
+# KEYS: retry set, stream. ARGV: member, then the stream fields.
+PROMOTE_SCRIPT = """
+if redis.call("ZREM", KEYS[1], ARGV[1]) == 0 then
+    return false
+end
+return redis.call("XADD", KEYS[2], "*", unpack(ARGV, 2))
+"""
+# KEYS: dead letter list, stream. ARGV: expected head entry, then the
+# stream fields. Another replayer may have taken the head since it was read.
+REPLAY_SCRIPT = """
+if redis.call("LINDEX", KEYS[1], 0) ~= ARGV[1] then
+    return false
+end
+redis.call("LPOP", KEYS[1])
+return redis.call("XADD", KEYS[2], "*", unpack(ARGV, 2))
+"""
+
+# Payloads that can never succeed; only these release the uploaded media.
+# JSON and pydantic validation errors are both ValueError subclasses.
+# Constraint and data errors raised when a savepoint flushes reach the
+# worker untranslated.
+VALIDATION_ERRORS = (
+    ValueError,
+    DataValidationException,
+    DuplicatedRecordException,
+    DataError,
+    IntegrityError,
+)
+
 
 class RedisWorker:
-    
-    def __init__(self):
-        self.redis_client = redis.Redis.from_url(settings.redis_internal_url)
+
+    def __init__(self, consumers: int = None, mode: str = None, stopping=None):
+        self.redis_client = get_redis()
+        self.promote_script = self.redis_client.register_script(PROMOTE_SCRIPT)
+        self.replay_script = self.redis_client.register_script(REPLAY_SCRIPT)
         self.orchestrator = ContentOrchestrator()
-        self.running = True
-        
-    def stop(self):
+        self.consumers = consumers or settings.worker_consumers
+        self.mode = mode or settings.worker_mode
+        self.context = get_context("spawn")
+        self.stream = settings.worker_stream
+        self.group = settings.worker_group
+        self.name = f"{socket.gethostname()}-{os.getpid()}"
+
+        if stopping is not None:
+            self.stopping = stopping
+        elif self.mode == "process" and self.consumers > 1:
+            self.stopping = self.context.Event()
+        else:
+            self.stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return not self.stopping.is_set()
+
+    def stop(self, signum=None, frame=None):
         logger.info("🛑 Stopping worker gracefully...")
-        self.running = False
-        
-    def process_event(self, key, value):
-        session = create_session()
-        
+        self.stopping.set()
+
+    def handle_event(self, key, value, session: Session, auto_commit: bool = True):
+        if key == "spring:content:upload:error":
+            logger.error(f"❌ Upload error: {value}")
+            return
+
+        payload = json.loads(value)
+        model = CreateContentDto.model_validate(payload)
+        content = self.orchestrator.register_content(model, session, auto_commit)
+
+        if content is None:
+            logger.info(f"⏭️ Skipped already registered upload: {model.upload_id}")
+        else:
+            logger.info(f"✅ Processed content: {payload}")
+
+    def complete_event(self, key, enqueued_at: float):
+        events_processed.labels(key).inc()
+        event_latency.observe(max(time.time() - enqueued_at, 0))
+
+    @event_processing.labels("single").time()
+    def process_event(self, key, value, attempts: int, enqueued_at: float, session: Session):
         try:
-            payload = json.loads(value)            
-            model = CreateContentDto.model_validate(payload)
-
-            if key == "spring:content:upload:success":
-                self.orchestrator.register_content(model, session)
-                logger.info(f"✅ Processed content: {payload}")
-            
-            elif key == "spring:content:upload:error":
-                logger.error(f"❌ Upload error: {payload}")
-                
-        except Exception:
+            self.handle_event(key, value, session)
+            self.complete_event(key, enqueued_at)
+
+        except Exception as e:
             logger.exception("❌ Critical error during processing")
-            self.redis_client.rpush("flask:metadata:save:rollback", value)
-            
+            session.rollback()
+            self.fail_event(key, value, attempts, enqueued_at, e)
+
+        finally:
+            session.expunge_all()
+
+    @event_processing.labels("batch").time()
+    def process_batch(self, events: list, session: Session):
+        failed = {}
+
+        try:
+            # Failures are keyed by position, since two entries may carry
+            # the same payload.
+            for index, (key, value, attempts, enqueued_at) in enumerate(events):
+                try:
+                    with session.begin_nested():
+                        self.handle_event(key, value, session, False)
+                except Exception as e:
+                    logger.exception("❌ Critical error during processing")
+                    failed[index] = (key, value, attempts, enqueued_at, e)
+            session.commit()
+
+        except Exception:
+            # The batch itself could not be committed, so fall back to one
+            # transaction per event to isolate whichever one is at fault.
+            logger.exception("❌ Batch commit failed, retrying events one by one")
+            session.rollback()
+            session.expunge_all()
+            for event in events:
+                self.process_event(*event, session)
+            return
+
+        finally:
+            session.expunge_all()
+
+        for index, (key, _, _, enqueued_at) in enumerate(events):
+            if index not in failed:
+                self.complete_event(key, enqueued_at)
+
+        with pipeline() as pipe:
+            for failure in failed.values():
+                self.fail_event(*failure, client=pipe)
+        logger.info(f"📦 Committed batch of {len(events) - len(failed)}/{len(events)} events")
+
+    def fail_event(self, key, value, attempts: int, enqueued_at: float, error: Exception, client=None):
+        # A pipeline may be passed in to send a batch's failures in one round trip.
+        if client is None:
+            client = self.redis_client
+
+        if isinstance(error, VALIDATION_ERRORS):
+            events_failed.labels("rollback").inc()
+            events_rolled_back.inc()
+            client.rpush(ROLLBACK_KEY, value)
+            return
+
+        attempts += 1
+        if attempts >= settings.worker_retry_limit:
+            events_failed.labels("dead_letter").inc()
+            logger.error(f"🪦 Giving up after {attempts} attempts, moving event to {DEAD_LETTER_KEY}")
+            client.rpush(
+                DEAD_LETTER_KEY,
+                dead_letter_entry(key, value, attempts, error)
+            )
+            return
+
+        events_failed.labels("retry").inc()
+        self.schedule_retry(key, value, attempts, enqueued_at, client)
+
+    def schedule_retry(self, key, value, attempts: int, enqueued_at: float, client=None):
+        if client is None:
+            client = self.redis_client
+
+        delay = retry_delay(attempts)
+        member = json.dumps({
+            "key": key,
+            "value": value,
+            "attempts": attempts,
+            "enqueued_at": enqueued_at
+        })
+
+        client.zadd(RETRY_KEY, {member: time.time() + delay})
+        logger.warning(f"🔁 Retry {attempts} scheduled in {delay:.1f}s")
+
+    def enqueue(self, key, value, attempts: int = 0, enqueued_at: float = None):
+        self.redis_client.xadd(
+            self.stream,
+            stream_fields(key, value, attempts, enqueued_at)
+        )
+
+    def promote_retries(self) -> int:
+        due = self.redis_client.zrangebyscore(
+            RETRY_KEY,
+            "-inf",
+            time.time(),
+            start=0,
+            num=settings.worker_claim_count
+        )
+
+        promoted = 0
+        for member in due:
+            event = json.loads(member)
+            fields = stream_fields(
+                event["key"],
+                event["value"],
+                event["attempts"],
+                event.get("enqueued_at")
+            )
+            # Only the consumer whose ZREM succeeds re-enqueues the event.
+            if self.promote_script(
+                keys=[RETRY_KEY, self.stream],
+                args=[member, *script_fields(fields)]
+            ):
+                promoted += 1
+        return promoted
+
+    def dead_letters(self, count: int = -1) -> list[dict]:
+        end = count - 1 if count > 0 else -1
+        return [
+            json.loads(entry)
+            for entry in self.redis_client.lrange(DEAD_LETTER_KEY, 0, end)
+        ]
+
+    def replay_dead_letters(self, count: int = -1) -> int:
+        replayed = 0
+        while count < 0 or replayed < count:
+            entry = self.redis_client.lindex(DEAD_LETTER_KEY, 0)
+            if entry is None:
+                break
+            event = json.loads(entry)
+            if self.replay_script(
+                keys=[DEAD_LETTER_KEY, self.stream],
+                args=[entry, *script_fields(stream_fields(event["key"], event["value"]))]
+            ):
+                replayed += 1
+        return replayed
+
+    def purge_dead_letters(self) -> int:
+        count = self.redis_client.llen(DEAD_LETTER_KEY)
+        self.redis_client.delete(DEAD_LETTER_KEY)
+        return count
+
+    def ensure_group(self):
+        try:
+            self.redis_client.xgroup_create(
+                self.stream,
+                self.group,
+                id="0",
+                mkstream=True
+            )
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def handle_entries(self, entries: list, session: Session):
+        # Entries trimmed from the stream while pending come back without fields.
+        events = [
+            parse_entry(entry_id, fields)
+            for entry_id, fields in entries
+            if fields
+        ]
+
+        if len(events) == 1:
+            self.process_event(*events[0], session)
+        elif events:
+            self.process_batch(events, session)
+
+        self.redis_client.xack(
+            self.stream,
+            self.group,
+            *[entry_id for entry_id, _ in entries]
+        )
+
+    def trim_stream(self) -> int:
+        # The producer no longer caps the stream, since MAXLEN would drop
+        # entries still pending here. Only what every group has acked goes.
+        floor = None
+        for group in self.redis_client.xinfo_groups(self.stream):
+            pending = self.redis_client.xpending(self.stream, group["name"])
+            floor = lower_id(floor, acked_floor(group, pending))
+
+        trimmed = 0
+        if floor is not None:
+            trimmed = self.redis_client.xtrim(self.stream, minid=floor, approximate=True)
+
+        length = self.redis_client.xlen(self.stream)
+        if length > settings.worker_stream_warn_length:
+            logger.warning(f"⚠️ {self.stream} has {length} events waiting to be acked")
+        return trimmed
+
+    def reclaim(self, consumer: str) -> list:
+        response = self.redis_client.xautoclaim(
+            self.stream,
+            self.group,
+            consumer,
+            min_idle_time=settings.worker_claim_idle,
+            start_id="0-0",
+            count=settings.worker_claim_count
+        )
+        entries = response[1]
+        if entries:
+            logger.warning(f"♻️ {consumer} reclaimed {len(entries)} pending events")
+        return entries
+
+    def read(self, consumer: str, count: int = 1, block: int = None) -> list:
+        response = self.redis_client.xreadgroup(
+            self.group,
+            consumer,
+            {self.stream: ">"},
+            count=count,
+            block=block or settings.worker_poll_timeout * 1000
+        )
+        return response[0][1] if response else []
+
+    def read_batch(self, consumer: str) -> list:
+        size = settings.worker_batch_size
+        entries = self.read(consumer, size)
+        deadline = time.monotonic() + settings.worker_batch_wait / 1000
+
+        while entries and len(entries) < size and self.running:
+            remaining = int((deadline - time.monotonic()) * 1000)
+            if remaining <= 0:
+                break
+            more = self.read(consumer, size - len(entries), remaining)
+            if not more:
+                break
+            entries.extend(more)
+        return entries
+
+    def consume(self, index: int = 0):
+        consumer = f"{self.name}-{index}"
+        logger.info(f"🎧 Consumer {consumer} listening to Redis in flask server...")
+        session = create_session()
+        group_ready = False
+        last_claim = 0.0
+        last_promote = 0.0
+        last_trim = time.monotonic()
+        failures = 0
+
+        try:
+            while self.running:
+                try:
+                    if not group_ready:
+                        self.ensure_group()
+                        group_ready = True
+
+                    if time.monotonic() - last_promote >= 1:
+                        self.promote_retries()
+                        last_promote = time.monotonic()
+
+                    if index == 0 and time.monotonic() - last_trim >= settings.worker_trim_interval:
+                        self.trim_stream()
+                        last_trim = time.monotonic()
+
+                    entries = []
+                    if time.monotonic() - last_claim >= settings.worker_claim_interval:
+                        entries = self.reclaim(consumer)
+                        last_claim = time.monotonic()
+
+                    entries = entries or self.read_batch(consumer)
+                    if entries:
+                        self.handle_entries(entries, session)
+                    failures = 0
+
+                except Exception:
+                    # Unacked entries stay pending and are reclaimed later, so
+                    # the consumer only has to survive and back off.
+                    failures += 1
+                    delay = min(2 ** (failures - 1), settings.worker_error_backoff)
+                    logger.exception(f"❌ Consumer {consumer} failed, retrying in {delay}s")
+                    session.rollback()
+                    session.expunge_all()
+                    self.stopping.wait(delay)
         finally:
             session.close()
-    
-    def run(self):
-        logger.info("🎧 Listening to Redis in flask server...")
+            logger.info(f"👋 Consumer {consumer} drained")
+
+    def sample_queues(self):
+        queue_length.labels("stream").set(self.redis_client.xlen(self.stream))
+        for group in self.redis_client.xinfo_groups(self.stream):
+            if group["name"].decode() == self.group:
+                queue_length.labels("pending").set(group["pending"])
+                # Redis 7 reports how many entries the group has not read yet.
+                if group.get("lag") is not None:
+                    queue_length.labels("lag").set(group["lag"])
 
+        queue_length.labels("retry").set(self.redis_client.zcard(RETRY_KEY))
+        queue_length.labels("dead_letter").set(self.redis_client.llen(DEAD_LETTER_KEY))
+        queue_length.labels("rollback").set(self.redis_client.llen(ROLLBACK_KEY))
+
+    def sample_metrics(self):
         while self.running:
-            events = self.redis_client.blpop([
-                "spring:content:upload:success", 
-                "spring:content:upload:error"
-            ])
-            
-            if events:
-                key = events[0].decode()
-                value = events[1].decode()
-                self.process_event(key, value)
-                
+            try:
+                self.sample_queues()
+            except redis.RedisError:
+                logger.exception("⚠️ Could not sample queue lengths")
+            self.stopping.wait(settings.worker_metrics_interval)
+
+    def run(self):
+        start_metrics_server()
+        threading.Thread(
+            target=self.sample_metrics,
+            name="metrics",
+            daemon=True
+        ).start()
+
+        if self.consumers == 1:
+            self.consume()
+            return
+
+        if self.mode == "process":
+            if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+                logger.warning("⚠️ PROMETHEUS_MULTIPROC_DIR is unset, consumer metrics will not be exported")
+            consumers = [
+                self.context.Process(
+                    target=run_consumer,
+                    args=(index, self.stopping),
+                    name=f"consumer-{index}"
+                )
+                for index in range(self.consumers)
+            ]
+        else:
+            consumers = [
+                threading.Thread(
+                    target=self.consume,
+                    args=(index,),
+                    name=f"consumer-{index}"
+                )
+                for index in range(self.consumers)
+            ]
+
+        for consumer in consumers:
+            consumer.start()
+
+        # Signals are only delivered to the main thread, so it waits here
+        # and lets each consumer finish its in-flight event once stopping.
+        dead = []
+        while self.running and not dead:
+            self.stopping.wait(1)
+            dead = [consumer.name for consumer in consumers if not consumer.is_alive()]
+
+        if dead:
+            logger.error(f"💀 {', '.join(dead)} exited unexpectedly, shutting down")
+            self.stopping.set()
+
+        for consumer in consumers:
+            consumer.join(settings.worker_drain_timeout)
+            if consumer.is_alive() and self.mode == "process":
+                logger.warning(f"⚠️ {consumer.name} did not drain in time, terminating")
+                consumer.terminate()
+
+        # A non-zero exit lets the supervisor restart the whole worker.
+        if dead:
+            raise SystemExit(1)
+
+
+def enqueue_time(entry_id: bytes, fields: dict) -> float:
+    if b"enqueued_at" in fields:
+        return float(fields[b"enqueued_at"])
+    # Auto-generated stream ids start with the XADD time in milliseconds.
+    return int(entry_id.split(b"-")[0]) / 1000
+
+
+def stream_id(entry_id: bytes) -> tuple[int, int]:
+    milliseconds, _, sequence = entry_id.decode().partition("-")
+    return int(milliseconds), int(sequence or 0)
+
+
+def acked_floor(group: dict, pending: dict) -> bytes:
+    # Entries below the oldest pending one, or up to the last delivered one
+    # when nothing is pending, have all been acked by this group.
+    return pending["min"] if pending["pending"] else group["last-delivered-id"]
+
+
+def lower_id(current, candidate: bytes):
+    if current is None or stream_id(candidate) < stream_id(current):
+        return candidate
+    return current
+
+
+def parse_entry(entry_id: bytes, fields: dict) -> tuple:
+    return (
+        fields[b"key"].decode(),
+        fields[b"value"].decode(),
+        int(fields.get(b"attempts", 0)),
+        enqueue_time(entry_id, fields)
+    )
+
+
+def stream_fields(key, value, attempts: int = 0, enqueued_at: float = None) -> dict:
+    fields = {"key": key, "value": value, "attempts": attempts}
+    # Retries keep the original enqueue time so latency stays end to end.
+    if enqueued_at is not None:
+        fields["enqueued_at"] = enqueued_at
+    return fields
+
+
+def script_fields(fields: dict) -> list:
+    return [item for pair in fields.items() for item in pair]
+
+
+def retry_delay(attempts: int) -> float:
+    delay = min(
+        settings.worker_retry_base * 2 ** (attempts - 1),
+        settings.worker_retry_max_delay
+    )
+    # Jitter keeps events that failed together from retrying together.
+    return delay * random.uniform(0.5, 1.0)
+
+
+def dead_letter_entry(key, value, attempts: int, error: Exception) -> str:
+    return json.dumps({
+        "key": key,
+        "value": value,
+        "attempts": attempts,
+        "error": repr(error),
+        "failed_at": datetime.now().isoformat()
+    })
+
+
+def run_consumer(index: int, stopping) -> None:
+    logging.basicConfig(level=logging.INFO)
+    # The parent owns shutdown; children just drain when the shared event fires.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    RedisWorker(consumers=1, stopping=stopping).consume(index)
+
+
+def inspect_dead_letters(worker: RedisWorker, args) -> None:
+    for index, event in enumerate(worker.dead_letters(args.count)):
+        print(f"[{index}] {event['failed_at']} attempts={event['attempts']} key={event['key']}")
+        print(f"    error: {event['error']}")
+        print(f"    value: {event['value']}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Content upload event worker")
+    commands = parser.add_subparsers(dest="command")
+
+    dead_letter = commands.add_parser("dead-letter", help="Inspect or replay dead-lettered events")
+    actions = dead_letter.add_subparsers(dest="action", required=True)
+
+    inspect = actions.add_parser("list", help="Show dead-lettered events, oldest first")
+    inspect.add_argument("--count", type=int, default=-1)
+
+    replay = actions.add_parser("replay", help="Re-enqueue dead-lettered events, oldest first")
+    replay.add_argument("--count", type=int, default=-1)
+
+    actions.add_parser("purge", help="Drop every dead-lettered event")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
+    args = parse_args()
     worker = RedisWorker()
-    
-    signal.signal(signal.SIGINT, worker.stop)
-    signal.signal(signal.SIGTERM, worker.stop)
-    
-    worker.run()
-    
\ No newline at end of file
+
+    if args.command == "dead-letter":
+        if args.action == "list":
+            inspect_dead_letters(worker, args)
+        elif args.action == "replay":
+            print(f"Replayed {worker.replay_dead_letters(args.count)} events")
+        elif args.action == "purge":
+            print(f"Purged {worker.purge_dead_letters()} events")
+    else:
+        signal.signal(signal.SIGINT, worker.stop)
+        signal.signal(signal.SIGTERM, worker.stop)
+
+        worker.run()
@@ -0,0 +1,323 @@
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+import time
+import redis
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config.async_sqlmodel_config import create_async_session, dispose_async_engine
+from app.config.redis_config import dispose_async_redis, get_async_redis
+from app.config.version_config import DEFER_PUBLISH, publish_changes_async, take_committed
+from app.config.metrics_config import (
+    event_latency,
+    event_processing,
+    events_failed,
+    events_processed,
+    events_rolled_back,
+    queue_length,
+    start_metrics_server,
+)
+from app.utils.settings import get_settings
+from app.orchestrators import ContentOrchestrator
+from app.dtos import CreateContentDto
+from worker_redis import (
+    DEAD_LETTER_KEY,
+    PROMOTE_SCRIPT,
+    RETRY_KEY,
+    ROLLBACK_KEY,
+    VALIDATION_ERRORS,
+    acked_floor,
+    dead_letter_entry,
+    lower_id,
+    parse_entry,
+    retry_delay,
+    script_fields,
+    stream_fields,
+)
+
+settings = get_settings()
+logger = logging.getLogger("worker")
+
+
+class AsyncRedisWorker:
+
+    def __init__(self, concurrency: int = None):
+        self.redis_client = get_async_redis()
+        self.promote_script = self.redis_client.register_script(PROMOTE_SCRIPT)
+        self.orchestrator = ContentOrchestrator()
+        self.concurrency = concurrency or settings.worker_async_concurrency
+        self.semaphore = asyncio.BoundedSemaphore(self.concurrency)
+        self.stopping = asyncio.Event()
+        self.tasks: set[asyncio.Task] = set()
+        self.stream = settings.worker_stream
+        self.group = settings.worker_group
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}-async"
+
+    @property
+    def running(self) -> bool:
+        return not self.stopping.is_set()
+
+    def stop(self):
+        logger.info("🛑 Stopping worker gracefully...")
+        self.stopping.set()
+
+    async def handle_event(self, key, value, session: AsyncSession):
+        if key == "spring:content:upload:error":
+            logger.error(f"❌ Upload error: {value}")
+            return
+
+        payload = json.loads(value)
+        model = CreateContentDto.model_validate(payload)
+        # The orchestrator's bulk insert and conflict handling run unchanged
+        # on the session's sync facade, awaiting the driver underneath.
+        session.sync_session.info[DEFER_PUBLISH] = True
+        content = await session.run_sync(
+            lambda sync_session: self.orchestrator.register_content(model, sync_session)
+        )
+        await publish_changes_async(take_committed(session.sync_session))
+
+        if content is None:
+            logger.info(f"⏭️ Skipped already registered upload: {model.upload_id}")
+        else:
+            logger.info(f"✅ Processed content: {payload}")
+
+    async def process_event(self, entry_id, fields):
+        key, value, attempts, enqueued_at = parse_entry(entry_id, fields)
+        session = create_async_session()
+        started = time.perf_counter()
+
+        try:
+            await self.handle_event(key, value, session)
+            events_processed.labels(key).inc()
+            event_latency.observe(max(time.time() - enqueued_at, 0))
+
+        except Exception as e:
+            logger.exception("❌ Critical error during processing")
+            await session.rollback()
+            await self.fail_event(key, value, attempts, enqueued_at, e)
+
+        finally:
+            await session.close()
+            event_processing.labels("async").observe(time.perf_counter() - started)
+
+    async def handle_entry(self, entry_id, fields):
+        try:
+            # Entries trimmed from the stream while pending come back without fields.
+            if fields:
+                await self.process_event(entry_id, fields)
+            await self.redis_client.xack(self.stream, self.group, entry_id)
+        finally:
+            self.semaphore.release()
+
+    async def fail_event(self, key, value, attempts: int, enqueued_at: float, error: Exception):
+        if isinstance(error, VALIDATION_ERRORS):
+            events_failed.labels("rollback").inc()
+            events_rolled_back.inc()
+            await self.redis_client.rpush(ROLLBACK_KEY, value)
+            return
+
+        attempts += 1
+        if attempts >= settings.worker_retry_limit:
+            events_failed.labels("dead_letter").inc()
+            logger.error(f"🪦 Giving up after {attempts} attempts, moving event to {DEAD_LETTER_KEY}")
+            await self.redis_client.rpush(
+                DEAD_LETTER_KEY,
+                dead_letter_entry(key, value, attempts, error)
+            )
+            return
+
+        events_failed.labels("retry").inc()
+        delay = retry_delay(attempts)
+        member = json.dumps({
+            "key": key,
+            "value": value,
+            "attempts": attempts,
+            "enqueued_at": enqueued_at
+        })
+        await self.redis_client.zadd(RETRY_KEY, {member: time.time() + delay})
+        logger.warning(f"🔁 Retry {attempts} scheduled in {delay:.1f}s")
+
+    async def promote_retries(self) -> int:
+        due = await self.redis_client.zrangebyscore(
+            RETRY_KEY,
+            "-inf",
+            time.time(),
+            start=0,
+            num=settings.worker_claim_count
+        )
+
+        promoted = 0
+        for member in due:
+            event = json.loads(member)
+            fields = stream_fields(
+                event["key"],
+                event["value"],
+                event["attempts"],
+                event.get("enqueued_at")
+            )
+            # Only the consumer whose ZREM succeeds re-enqueues the event.
+            if await self.promote_script(
+                keys=[RETRY_KEY, self.stream],
+                args=[member, *script_fields(fields)]
+            ):
+                promoted += 1
+        return promoted
+
+    async def ensure_group(self):
+        try:
+            await self.redis_client.xgroup_create(
+                self.stream,
+                self.group,
+                id="0",
+                mkstream=True
+            )
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def trim_stream(self) -> int:
+        # Same as RedisWorker.trim_stream: only entries every group acked.
+        floor = None
+        for group in await self.redis_client.xinfo_groups(self.stream):
+            pending = await self.redis_client.xpending(self.stream, group["name"])
+            floor = lower_id(floor, acked_floor(group, pending))
+
+        trimmed = 0
+        if floor is not None:
+            trimmed = await self.redis_client.xtrim(self.stream, minid=floor, approximate=True)
+
+        length = await self.redis_client.xlen(self.stream)
+        if length > settings.worker_stream_warn_length:
+            logger.warning(f"⚠️ {self.stream} has {length} events waiting to be acked")
+        return trimmed
+
+    async def reclaim(self) -> list:
+        response = await self.redis_client.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer,
+            min_idle_time=settings.worker_claim_idle,
+            start_id="0-0",
+            count=settings.worker_claim_count
+        )
+        entries = response[1]
+        if entries:
+            logger.warning(f"♻️ {self.consumer} reclaimed {len(entries)} pending events")
+        return entries
+
+    async def read(self, count: int) -> list:
+        response = await self.redis_client.xreadgroup(
+            self.group,
+            self.consumer,
+            {self.stream: ">"},
+            count=count,
+            block=settings.worker_poll_timeout * 1000
+        )
+        return response[0][1] if response else []
+
+    async def sample_queues(self):
+        while self.running:
+            try:
+                queue_length.labels("stream").set(await self.redis_client.xlen(self.stream))
+                for group in await self.redis_client.xinfo_groups(self.stream):
+                    if group["name"].decode() == self.group:
+                        queue_length.labels("pending").set(group["pending"])
+                        if group.get("lag") is not None:
+                            queue_length.labels("lag").set(group["lag"])
+                queue_length.labels("retry").set(await self.redis_client.zcard(RETRY_KEY))
+                queue_length.labels("dead_letter").set(await self.redis_client.llen(DEAD_LETTER_KEY))
+                queue_length.labels("rollback").set(await self.redis_client.llen(ROLLBACK_KEY))
+            except redis.RedisError:
+                logger.exception("⚠️ Could not sample queue lengths")
+
+            try:
+                await asyncio.wait_for(self.stopping.wait(), settings.worker_metrics_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def spawn(self, entry_id, fields):
+        task = asyncio.create_task(self.handle_entry(entry_id, fields))
+        self.tasks.add(task)
+        task.add_done_callback(self.task_done)
+
+    def task_done(self, task: asyncio.Task):
+        self.tasks.discard(task)
+        # process_event handles event failures; what reaches here is an
+        # error around it, such as a failed XACK, left pending for reclaim.
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("❌ Event task failed", exc_info=task.exception())
+
+    async def consume(self):
+        logger.info(f"🎧 Consumer {self.consumer} listening to Redis with {self.concurrency} slots...")
+        await self.ensure_group()
+        last_claim = 0.0
+        last_promote = 0.0
+        last_trim = time.monotonic()
+
+        while self.running:
+            if time.monotonic() - last_promote >= 1:
+                await self.promote_retries()
+                last_promote = time.monotonic()
+
+            if time.monotonic() - last_trim >= settings.worker_trim_interval:
+                await self.trim_stream()
+                last_trim = time.monotonic()
+
+            entries = []
+            if time.monotonic() - last_claim >= settings.worker_claim_interval:
+                entries = await self.reclaim()
+                last_claim = time.monotonic()
+
+            # A free slot is taken before reading so the stream is only
+            # consumed as fast as events can actually be handled.
+            if entries:
+                for entry_id, fields in entries:
+                    await self.semaphore.acquire()
+                    self.spawn(entry_id, fields)
+                continue
+
+            # Wait for one slot, then take whichever others are free so a
+            # single read can fill them.
+            await self.semaphore.acquire()
+            slots = 1
+            while slots < settings.worker_async_read_count and not self.semaphore.locked():
+                await self.semaphore.acquire()
+                slots += 1
+
+            read = await self.read(slots)
+            for _ in range(slots - len(read)):
+                self.semaphore.release()
+            for entry_id, fields in read:
+                self.spawn(entry_id, fields)
+
+    async def run(self):
+        start_metrics_server()
+        sampler = asyncio.create_task(self.sample_queues())
+
+        try:
+            await self.consume()
+        finally:
+            if self.tasks:
+                logger.info(f"⏳ Draining {len(self.tasks)} in-flight events...")
+                await asyncio.wait(self.tasks, timeout=settings.worker_drain_timeout)
+            sampler.cancel()
+            await dispose_async_redis()
+            await dispose_async_engine()
+            logger.info(f"👋 Consumer {self.consumer} drained")
+
+
+async def main():
+    worker = AsyncRedisWorker()
+    loop = asyncio.get_running_loop()
+
+    loop.add_signal_handler(signal.SIGINT, worker.stop)
+    loop.add_signal_handler(signal.SIGTERM, worker.stop)
+
+    await worker.run()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
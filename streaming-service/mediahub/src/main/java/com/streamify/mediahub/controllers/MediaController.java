@@ -3,6 +3,7 @@ package com.streamify.mediahub.controllers;
 import com.streamify.mediahub.dto.BodyFilesDTO;
 import com.streamify.mediahub.dto.ResponseErrorDTO;
 import com.streamify.mediahub.services.MediaService;
+import com.streamify.mediahub.services.MediaTokenService;
 import com.streamify.mediahub.services.RedisService;
 import jakarta.servlet.http.HttpServletRequest;
 import org.springframework.beans.factory.annotation.Value;
@@ -24,10 +25,16 @@ public class MediaController {
 
     private final MediaService mediaService;
     private final RedisService redisService;
+    private final MediaTokenService mediaTokenService;
 
-    public MediaController(MediaService mediaService, RedisService redisService) {
+    public MediaController(
+            MediaService mediaService,
+            RedisService redisService,
+            MediaTokenService mediaTokenService
+    ) {
         this.mediaService = mediaService;
         this.redisService = redisService;
+        this.mediaTokenService = mediaTokenService;
     }
 
     @PostMapping(path = "/upload")
@@ -54,7 +61,15 @@ public class MediaController {
     }
 
     @GetMapping("/thumbnails/{thumbnailFile}")
-    public ResponseEntity<?> getThumbnails(@PathVariable String thumbnailFile) {
+    public ResponseEntity<?> getThumbnails(
+            @PathVariable String thumbnailFile,
+            @RequestParam(required = false) Long expires,
+            @RequestParam(required = false) String token
+    ) {
+        if (!mediaTokenService.verify(thumbnailFile, expires, token)) {
+            return ResponseEntity.status(HttpStatus.FORBIDDEN).build();
+        }
+
         try {
             UrlResource thumbnailData = mediaService.getThumbnail(thumbnailFile);
             return ResponseEntity
@@ -72,12 +87,20 @@ public class MediaController {
         }
     }
 
-    @GetMapping(value = "/streaming/{fileName}/")
+    // The trailing-slash form is kept for URLs handed out before the
+    // query string stopped being joined as a path segment.
+    @GetMapping(value = {"/streaming/{fileName}", "/streaming/{fileName}/"})
     public ResponseEntity<ResourceRegion> contentStream(
             @PathVariable String fileName,
             @RequestParam String source,
+            @RequestParam(required = false) Long expires,
+            @RequestParam(required = false) String token,
             @RequestHeader HttpHeaders headers
     ) {
+        if (!mediaTokenService.verify(fileName, expires, token)) {
+            return ResponseEntity.status(HttpStatus.FORBIDDEN).build();
+        }
+
         FileSystemResource video = mediaService.getResource(fileName, source);
         HttpRange range = headers.getRange().isEmpty() ? null : headers.getRange().get(0);
 
@@ -141,6 +141,7 @@ public class MediaService {
                 throw new RuntimeException(e);
             }
         }
+        filePaths.put("uploadId", customName);
         return filePaths;
     }
 
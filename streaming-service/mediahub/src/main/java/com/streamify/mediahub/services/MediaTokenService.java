@@ -0,0 +1,47 @@
+package com.streamify.mediahub.services;
+
+import jakarta.annotation.PostConstruct;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.stereotype.Service;
+import javax.crypto.Mac;
+import javax.crypto.spec.SecretKeySpec;
+import java.nio.charset.StandardCharsets;
+import java.security.GeneralSecurityException;
+import java.security.MessageDigest;
+import java.util.Base64;
+
+@Service
+public class MediaTokenService {
+
+    @Value("${media.signing-key:}")
+    private String signingKey;
+
+    private SecretKeySpec key;
+
+    @PostConstruct
+    public void init() {
+        if (!signingKey.isEmpty()) {
+            key = new SecretKeySpec(signingKey.getBytes(StandardCharsets.UTF_8), "HmacSHA256");
+        }
+    }
+
+    // Mirrors sign_media in the Flask service: HMAC-SHA256 over "file:expires".
+    public boolean verify(String file, Long expires, String token) {
+        if (key == null) {
+            return true;
+        }
+        if (expires == null || token == null || expires < System.currentTimeMillis() / 1000) {
+            return false;
+        }
+
+        try {
+            Mac mac = Mac.getInstance("HmacSHA256");
+            mac.init(key);
+            byte[] digest = mac.doFinal((file + ":" + expires).getBytes(StandardCharsets.UTF_8));
+            byte[] expected = Base64.getUrlEncoder().withoutPadding().encode(digest);
+            return MessageDigest.isEqual(expected, token.getBytes(StandardCharsets.UTF_8));
+        } catch (GeneralSecurityException e) {
+            throw new RuntimeException("Could not verify media token", e);
+        }
+    }
+}
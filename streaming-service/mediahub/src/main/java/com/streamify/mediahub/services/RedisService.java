@@ -5,6 +5,7 @@ import jakarta.annotation.PostConstruct;
 import org.springframework.beans.factory.annotation.Value;
 import org.springframework.stereotype.Service;
 import redis.clients.jedis.Jedis;
+import redis.clients.jedis.params.XAddParams;
 import java.util.Map;
 
 @Service
@@ -16,6 +17,9 @@ public class RedisService {
     @Value("${redis.port}")
     private int port;
 
+    @Value("${redis.stream.key}")
+    private String streamKey;
+
     private Jedis jedis;
     private Gson gson;
 
@@ -28,10 +32,14 @@ public class RedisService {
     }
     
     public void push(String key, Map<String, Object> value) {
-        jedis.rpush(key, gson.toJson(value));
+        push(key, gson.toJson(value));
     }
 
-    public void push(String key, String value) {
-        jedis.rpush(key, value);
+    public synchronized void push(String key, String value) {
+        jedis.xadd(
+            streamKey,
+            XAddParams.xAddParams(),
+            Map.of("key", key, "value", String.valueOf(value))
+        );
     }
 }